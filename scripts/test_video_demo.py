@@ -185,7 +185,9 @@ class ImageCanvas(QGraphicsView):
             height=int(rect.height()),
             label=f"ROI {len(self._roi_manager) + 1}"
         )
-        item = ROIGraphicsItem(roi)
+        item = ROIGraphicsItem(
+            roi, on_geometry_changed=self._roi_manager.sync_geometry
+        )
         self._scene.addItem(item)
         self._roi_items[roi.id] = item
         return roi
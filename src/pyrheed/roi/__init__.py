@@ -11,6 +11,7 @@ from pyrheed.roi.intensity import (
     calculate_frame_intensity,
     IntensityTracker,
 )
+from pyrheed.roi.stats import compute_means
 
 __all__ = [
     "ROI",
@@ -19,4 +20,5 @@ __all__ = [
     "calculate_roi_intensity",
     "calculate_frame_intensity",
     "IntensityTracker",
+    "compute_means",
 ]
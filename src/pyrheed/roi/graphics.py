@@ -51,10 +51,19 @@ class ROIGraphicsItem(QGraphicsRectItem):
     HANDLE_SIZE = 8
     MIN_SIZE = 10  # Minimum ROI size
 
-    def __init__(self, roi: ROI, parent: Optional[QGraphicsItem] = None) -> None:
+    def __init__(
+        self,
+        roi: ROI,
+        parent: Optional[QGraphicsItem] = None,
+        on_geometry_changed=None,
+    ) -> None:
         # Initialize with rect dimensions
         super().__init__(0, 0, roi.width, roi.height, parent)
         self._roi = roi
+        # Called with the ROI id after each sync_to_roi; pass
+        # ROIManager.sync_geometry here so drags and resizes keep the
+        # manager's hit-test bounds current
+        self._on_geometry_changed = on_geometry_changed
         self._handles_visible = False
         self._resizing = False
         self._resize_handle = HandlePosition.NONE
@@ -121,6 +130,8 @@ class ROIGraphicsItem(QGraphicsRectItem):
         self._roi.y = int(pos.y())
         self._roi.width = int(rect.width())
         self._roi.height = int(rect.height())
+        if self._on_geometry_changed is not None:
+            self._on_geometry_changed(self._roi.id)
 
     def sync_from_roi(self) -> None:
         """Update item from ROI data."""
@@ -4,7 +4,6 @@ Provides functions to calculate mean intensity within ROIs
 and track intensity changes over time.
 """
 
-from collections import defaultdict
 from typing import Optional
 
 import numpy as np
@@ -13,6 +12,22 @@ from numpy.typing import NDArray
 from pyrheed.roi.model import ROI
 
 
+# ITU-R BT.601 luma coefficients, allocated once
+_LUMA_COEFFS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def _gray_max(frame: NDArray[np.uint8]) -> float:
+    """Maximum grayscale value over the whole frame.
+
+    For mono frames this is a SIMD max over the raw uint8 buffer;
+    RGB frames need the weighted sum, done as one matmul.
+    """
+    if frame.ndim == 2:
+        return float(frame.max())
+    gray = frame.reshape(-1, 3).astype(np.float32, copy=False) @ _LUMA_COEFFS
+    return float(gray.max())
+
+
 def calculate_frame_intensity(
     frame: NDArray[np.uint8],
     normalize: bool = True
@@ -65,18 +80,7 @@ def calculate_roi_intensity(
         Mean intensity value, or None if ROI is outside image.
         If normalized, returns value in range [0, 1].
     """
-    # Get frame dimensions
-    if frame.ndim == 2:
-        height, width = frame.shape
-        grayscale = frame.astype(np.float32)
-    else:
-        height, width = frame.shape[:2]
-        # Convert RGB to grayscale using luminosity method
-        grayscale = (
-            0.299 * frame[:, :, 0] +
-            0.587 * frame[:, :, 1] +
-            0.114 * frame[:, :, 2]
-        ).astype(np.float32)
+    height, width = frame.shape[:2]
 
     # Calculate intersection with image bounds
     x1 = max(0, roi.x)
@@ -88,13 +92,20 @@ def calculate_roi_intensity(
     if x1 >= x2 or y1 >= y2:
         return None
 
-    # Extract region and calculate mean
-    region = grayscale[y1:y2, x1:x2]
-    mean_intensity = float(np.mean(region))
+    # Slice first, convert after: only the ROI view is promoted, not
+    # the whole frame
+    region = frame[y1:y2, x1:x2]
+    if frame.ndim == 3:
+        # Weighted gray as a single matmul over the ROI pixels
+        gray = region.reshape(-1, 3).astype(np.float32, copy=False)
+        mean_intensity = float((gray @ _LUMA_COEFFS).mean(dtype=np.float64))
+    else:
+        mean_intensity = float(region.mean(dtype=np.float64))
 
-    # Normalize by image max if requested
+    # Normalize by image max if requested (the only step that still
+    # has to look at the whole frame)
     if normalize:
-        img_max = float(np.max(grayscale))
+        img_max = _gray_max(frame)
         if img_max > 0:
             return mean_intensity / img_max
         return 0.0
@@ -102,6 +113,102 @@ def calculate_roi_intensity(
     return mean_intensity
 
 
+class _ROIHistory:
+    """Ring-buffered (frame_index, intensity) series for one ROI.
+
+    Structure-of-arrays storage: two preallocated numpy buffers plus
+    a frame_index -> slot map, so add() is O(1) with no per-sample
+    tuple/dict-entry churn on long runs. When full, the oldest
+    insertion is overwritten.
+    """
+
+    __slots__ = ("frames", "values", "slots", "head", "count")
+
+    def __init__(self, capacity: int) -> None:
+        self.frames = np.empty(capacity, dtype=np.int64)
+        self.values = np.empty(capacity, dtype=np.float64)
+        self.slots: dict[int, int] = {}  # frame_index -> buffer slot
+        self.head = 0  # Next slot to (over)write
+        self.count = 0
+
+    def add(self, frame_index: int, intensity: float) -> None:
+        """Insert a sample, updating in place on a repeated index."""
+        slot = self.slots.get(frame_index)
+        if slot is not None:
+            self.values[slot] = intensity
+            return
+
+        capacity = len(self.frames)
+        if self.count == capacity:
+            del self.slots[int(self.frames[self.head])]
+        else:
+            self.count += 1
+        self.frames[self.head] = frame_index
+        self.values[self.head] = intensity
+        self.slots[frame_index] = self.head
+        self.head = (self.head + 1) % capacity
+
+    def add_many(
+        self,
+        frame_indices: NDArray[np.int64],
+        intensities: NDArray[np.float64],
+    ) -> None:
+        """Insert a batch of samples with two array copies when possible.
+
+        The fast path handles the common producer pattern — a strictly
+        increasing block of new frame indices appended to an empty or
+        non-wrapping buffer — as vectorized slice assignments. Anything
+        irregular (duplicates, wrap-around, oversized batches) falls
+        back to per-sample add(), which already handles every case.
+        """
+        n = len(frame_indices)
+        if n == 0:
+            return
+
+        capacity = len(self.frames)
+        fast = (
+            n <= capacity - self.count
+            and self.head + n <= capacity
+            and (n == 1 or bool(np.all(np.diff(frame_indices) > 0)))
+            and (not self.slots or frame_indices[0] not in self.slots)
+        )
+        if fast and self.count > 0:
+            # New indices must not collide with stored ones; a single
+            # isin scan is still vectorized
+            fast = not bool(np.any(np.isin(frame_indices, self.frames[: self.count])))
+
+        if fast:
+            start = self.head
+            self.frames[start : start + n] = frame_indices
+            self.values[start : start + n] = intensities
+            for offset, frame_index in enumerate(frame_indices.tolist()):
+                self.slots[frame_index] = start + offset
+            self.head = (start + n) % capacity
+            self.count += n
+            return
+
+        for frame_index, intensity in zip(
+            frame_indices.tolist(), intensities.tolist()
+        ):
+            self.add(frame_index, intensity)
+
+    def history(self) -> list[tuple[int, float]]:
+        """Samples as (frame_index, intensity), sorted by index."""
+        frames = self.frames[: self.count]
+        order = np.argsort(frames, kind="stable")
+        return list(zip(
+            frames[order].tolist(),
+            self.values[: self.count][order].tolist(),
+        ))
+
+    def latest(self) -> Optional[float]:
+        """Intensity at the highest recorded frame index."""
+        if self.count == 0:
+            return None
+        slot = int(np.argmax(self.frames[: self.count]))
+        return float(self.values[slot])
+
+
 class IntensityTracker:
     """Tracks intensity measurements over time for multiple ROIs.
 
@@ -122,8 +229,8 @@ class IntensityTracker:
         Args:
             max_history: Maximum number of measurements to keep per ROI.
         """
-        # Store as dict[roi_id, dict[frame_index, intensity]]
-        self._data: dict[str, dict[int, float]] = defaultdict(dict)
+        # One SoA ring buffer per ROI (see _ROIHistory)
+        self._data: dict[str, _ROIHistory] = {}
         self._max_history = max_history
 
     def __len__(self) -> int:
@@ -139,15 +246,34 @@ class IntensityTracker:
             frame_index: Frame number.
             intensity: Measured intensity value.
         """
-        data = self._data[roi_id]
-        data[frame_index] = intensity
+        history = self._data.get(roi_id)
+        if history is None:
+            history = self._data[roi_id] = _ROIHistory(self._max_history)
+        history.add(frame_index, intensity)
+
+    def add_many(
+        self,
+        roi_id: str,
+        frame_indices: NDArray[np.integer],
+        intensities: NDArray[np.floating],
+    ) -> None:
+        """Add a batch of measurements for one ROI in a single call.
+
+        Equivalent to calling add() per sample, but a contiguous run of
+        new frame indices is inserted as vectorized array copies.
 
-        # Trim to max length if exceeded
-        if len(data) > self._max_history:
-            # Keep most recent entries
-            sorted_keys = sorted(data.keys())
-            for key in sorted_keys[:-self._max_history]:
-                del data[key]
+        Args:
+            roi_id: ROI identifier.
+            frame_indices: Frame numbers, one per sample.
+            intensities: Measured intensity values, same length.
+        """
+        history = self._data.get(roi_id)
+        if history is None:
+            history = self._data[roi_id] = _ROIHistory(self._max_history)
+        history.add_many(
+            np.asarray(frame_indices, dtype=np.int64),
+            np.asarray(intensities, dtype=np.float64),
+        )
 
     def get_history(self, roi_id: str) -> list[tuple[int, float]]:
         """Get intensity history for ROI.
@@ -158,8 +284,10 @@ class IntensityTracker:
         Returns:
             List of (frame_index, intensity) tuples, sorted by frame_index.
         """
-        data = self._data.get(roi_id, {})
-        return sorted(data.items())
+        history = self._data.get(roi_id)
+        if history is None:
+            return []
+        return history.history()
 
     def get_latest(self, roi_id: str) -> Optional[float]:
         """Get most recent intensity for ROI.
@@ -170,11 +298,10 @@ class IntensityTracker:
         Returns:
             Latest intensity value, or None if no history.
         """
-        data = self._data.get(roi_id)
-        if data:
-            max_frame = max(data.keys())
-            return data[max_frame]
-        return None
+        history = self._data.get(roi_id)
+        if history is None:
+            return None
+        return history.latest()
 
     def clear_roi(self, roi_id: str) -> None:
         """Clear history for specific ROI.
@@ -198,4 +325,5 @@ class IntensityTracker:
         Returns:
             Number of frames with recorded intensity.
         """
-        return len(self._data.get(roi_id, {}))
+        history = self._data.get(roi_id)
+        return history.count if history is not None else 0
@@ -7,8 +7,14 @@ from dataclasses import dataclass, field
 from typing import Iterator, Optional
 import uuid
 
+import numpy as np
 
-# Default color palette for ROIs
+
+# Default color palette for ROIs. The curated head keeps the familiar
+# colors first; the remaining 54 entries are precomputed offline with
+# golden-ratio hue stepping over three saturation/value tiers, so the
+# first 64 auto-assigned colors are all distinct with an O(1) lookup
+# (no per-add hashing or HSV conversion).
 DEFAULT_COLORS = [
     "#FF6B6B",  # Red
     "#4ECDC4",  # Teal
@@ -20,6 +26,15 @@ DEFAULT_COLORS = [
     "#F7DC6F",  # Gold
     "#BB8FCE",  # Purple
     "#85C1E9",  # Light Blue
+    "#5984EB", "#9BBF69", "#99228A", "#59EBD2", "#BF9869", "#3F2299",
+    "#5FEB59", "#BF6986", "#226C99", "#DFEB59", "#AD69BF", "#22995D",
+    "#EB7759", "#6971BF", "#4F9922", "#EB59BA", "#69BCBF", "#997B22",
+    "#9B59EB", "#69BF77", "#992231", "#5996EB", "#A6BF69", "#992299",
+    "#59EBC0", "#BF8D69", "#302299", "#72EB59", "#BF6991", "#227C99",
+    "#EBE459", "#A269BF", "#22994E", "#EB6559", "#697CBF", "#5E9922",
+    "#EB59CD", "#69BFB8", "#996C22", "#8959EB", "#69BF6C", "#992240",
+    "#59A9EB", "#B1BF69", "#892299", "#59EBAD", "#BF8269", "#222299",
+    "#84EB59", "#BF699C", "#228B99", "#EBD159", "#9769BF", "#22993F",
 ]
 
 
@@ -28,10 +43,17 @@ def _generate_id() -> str:
     return str(uuid.uuid4())[:8]
 
 
-@dataclass
+@dataclass(slots=True)
 class ROI:
     """Region of Interest on an image.
 
+    Slotted: thousands of ROIs are ~3x smaller without per-instance
+    dicts. Instances stay mutable — graphics items sync drag/resize
+    geometry back into the ROI in place, which also rules out caching
+    bounds/center (they would go stale on every drag). Code mutating
+    geometry of a manager-tracked ROI in place must follow up with
+    ROIManager.sync_geometry so hit testing sees the change.
+
     Attributes:
         x: Left edge x coordinate.
         y: Top edge y coordinate.
@@ -81,17 +103,23 @@ class ROIManager:
     """
 
     def __init__(self) -> None:
-        self._rois: dict[str, ROI] = {}
+        # Contiguous list of ROIs, row-parallel with the SoA bounds
+        # block used for vectorized hit-testing; _rows maps id -> row
+        # for O(1) lookup. Iteration is a C-level list walk instead
+        # of a dict-values walk.
+        self._rois: list[ROI] = []
+        self._rows: dict[str, int] = {}
+        self._bounds = np.empty((8, 4), dtype=np.int32)
         self._color_index = 0
 
     def __len__(self) -> int:
         return len(self._rois)
 
     def __contains__(self, roi_id: str) -> bool:
-        return roi_id in self._rois
+        return roi_id in self._rows
 
     def __iter__(self) -> Iterator[ROI]:
-        return iter(self._rois.values())
+        return iter(self._rois)
 
     def _next_color(self) -> str:
         """Get next color from palette."""
@@ -130,7 +158,15 @@ class ROIManager:
             color=roi_color,
             label=label,
         )
-        self._rois[roi.id] = roi
+        row = len(self._rois)
+        if row == len(self._bounds):
+            grown = np.empty((row * 2, 4), dtype=np.int32)
+            grown[:row] = self._bounds
+            self._bounds = grown
+        self._bounds[row] = (x, y, width, height)
+        self._rois.append(roi)
+        self._rows[roi.id] = row
+
         return roi
 
     def get(self, roi_id: str) -> Optional[ROI]:
@@ -142,7 +178,8 @@ class ROIManager:
         Returns:
             The ROI if found, None otherwise.
         """
-        return self._rois.get(roi_id)
+        row = self._rows.get(roi_id)
+        return self._rois[row] if row is not None else None
 
     def remove(self, roi_id: str) -> bool:
         """Remove ROI by ID.
@@ -153,10 +190,22 @@ class ROIManager:
         Returns:
             True if removed, False if not found.
         """
-        if roi_id in self._rois:
-            del self._rois[roi_id]
-            return True
-        return False
+        row = self._rows.pop(roi_id, None)
+        if row is None:
+            return False
+
+        # Shift the tail down instead of swap-and-pop: row order is
+        # the recency order hit_test documents for overlapping hits,
+        # and moving the last row forward would rewrite it. The shift
+        # is one C-level memmove plus a row-index walk, and removal
+        # is rare next to hit testing.
+        count = len(self._rois)
+        self._rois.pop(row)
+        self._bounds[row:count - 1] = self._bounds[row + 1:count]
+        for moved in self._rois[row:]:
+            self._rows[moved.id] -= 1
+
+        return True
 
     def update(self, roi_id: str, **kwargs) -> bool:
         """Update ROI properties.
@@ -168,17 +217,78 @@ class ROIManager:
         Returns:
             True if updated, False if ROI not found.
         """
-        roi = self._rois.get(roi_id)
-        if roi is None:
+        row = self._rows.get(roi_id)
+        if row is None:
             return False
 
+        roi = self._rois[row]
         for key, value in kwargs.items():
             if hasattr(roi, key) and key != "id":
                 setattr(roi, key, value)
 
+        # Keep the SoA geometry mirror in sync
+        self._bounds[row] = (roi.x, roi.y, roi.width, roi.height)
+
         return True
 
+    def sync_geometry(self, roi_id: str) -> bool:
+        """Refresh the bounds mirror from an ROI mutated in place.
+
+        Graphics items write drag/resize geometry straight into the
+        ROI object; without this call hit_test would keep answering
+        from the pre-drag bounds. ROIGraphicsItem takes this method
+        as its on_geometry_changed callback.
+
+        Args:
+            roi_id: The ROI identifier.
+
+        Returns:
+            True if the ROI exists, False otherwise.
+        """
+        row = self._rows.get(roi_id)
+        if row is None:
+            return False
+
+        roi = self._rois[row]
+        self._bounds[row] = (roi.x, roi.y, roi.width, roi.height)
+
+        return True
+
+    def hit_test(self, px: int, py: int) -> Optional[str]:
+        """Find the ROI containing a point, vectorized over all ROIs.
+
+        One fused compare over the SoA bounds block replaces a Python
+        loop of ROI.contains calls, which matters when mouse-move
+        events test every ROI hundreds of times per second.
+
+        Args:
+            px: Point x coordinate.
+            py: Point y coordinate.
+
+        Returns:
+            The id of the most recently added ROI containing the
+            point, or None if no ROI contains it.
+        """
+        count = len(self._rois)
+        if count == 0:
+            return None
+
+        bounds = self._bounds[:count]
+        hits = (
+            (px >= bounds[:, 0])
+            & (px < bounds[:, 0] + bounds[:, 2])
+            & (py >= bounds[:, 1])
+            & (py < bounds[:, 1] + bounds[:, 3])
+        )
+        if not hits.any():
+            return None
+
+        # Last hit row wins: most recently added, drawn on top
+        row = count - 1 - int(np.argmax(hits[::-1]))
+        return self._rois[row].id
+
     def clear(self) -> None:
         """Remove all ROIs."""
         self._rois.clear()
+        self._rows.clear()
         self._color_index = 0
@@ -4,6 +4,7 @@ Provides frame sources for image sequences, video files, and camera input.
 """
 
 from pyrheed.video.source import FrameSource, SourceState
+from pyrheed.video.frame_ring import FrameRing
 from pyrheed.video.image_sequence import ImageSequenceSource
 from pyrheed.video.video_file import VideoFileSource
 from pyrheed.video.camera import CameraSource, enumerate_cameras
@@ -11,6 +12,7 @@ from pyrheed.video.camera import CameraSource, enumerate_cameras
 __all__ = [
     "FrameSource",
     "SourceState",
+    "FrameRing",
     "ImageSequenceSource",
     "VideoFileSource",
     "CameraSource",
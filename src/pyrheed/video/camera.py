@@ -3,40 +3,93 @@
 Provides real-time frame capture from camera/CCD devices using OpenCV.
 """
 
+import glob
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import cv2
 import numpy as np
 from numpy.typing import NDArray
-from PyQt6.QtCore import QThread, QMutex, QMutexLocker
+from PyQt6.QtCore import QThread, pyqtSignal
 
+from pyrheed.video.frame_ring import FrameRing
 from pyrheed.video.source import FrameSource, SourceState
 
 
-def enumerate_cameras(max_devices: int = 10) -> list[dict]:
+def _probe_camera(device_id: int) -> Optional[dict]:
+    """Probe a single camera device.
+
+    Args:
+        device_id: Device index to open.
+
+    Returns:
+        Device info dict if the device is available, None otherwise.
+    """
+    cap = cv2.VideoCapture(device_id)
+    if not cap.isOpened():
+        return None
+
+    # Try to get device name (platform-dependent)
+    backend = cap.getBackendName()
+    cap.release()
+
+    return {
+        "id": device_id,
+        "name": f"Camera {device_id} ({backend})",
+        "available": True,
+    }
+
+
+# Probe results cached for the process lifetime, keyed by max_devices
+_ENUM_CACHE: dict[int, list[dict]] = {}
+
+
+def enumerate_cameras(max_devices: int = 10, force: bool = False) -> list[dict]:
     """Enumerate available camera devices.
 
+    Each cv2.VideoCapture open can block for seconds while the driver
+    negotiates, so devices are probed in parallel: total latency is
+    bounded by the slowest device instead of the sum. On Linux, IDs
+    without a /dev/video node are skipped up front. Results are
+    cached for the process lifetime — cameras rarely appear
+    mid-session, and re-probing stalls the UI for seconds.
+
     Args:
         max_devices: Maximum number of devices to check.
+        force: Re-probe instead of returning the cached result.
 
     Returns:
         List of dicts with device info: {id, name, available}
     """
-    devices = []
+    if not force and max_devices in _ENUM_CACHE:
+        return list(_ENUM_CACHE[max_devices])
+
+    device_ids = list(range(max_devices))
+
+    # Short-circuit via /dev/video* when the nodes are visible
+    # (fall back to probing the full range otherwise, e.g. containers)
+    if sys.platform.startswith("linux"):
+        nodes = {
+            int(node.removeprefix("/dev/video"))
+            for node in glob.glob("/dev/video*")
+            if node.removeprefix("/dev/video").isdigit()
+        }
+        if nodes:
+            device_ids = [i for i in device_ids if i in nodes]
+
+    if not device_ids:
+        _ENUM_CACHE[max_devices] = []
+        return []
 
-    for i in range(max_devices):
-        cap = cv2.VideoCapture(i)
-        if cap.isOpened():
-            # Try to get device name (platform-dependent)
-            backend = cap.getBackendName()
-            devices.append({
-                "id": i,
-                "name": f"Camera {i} ({backend})",
-                "available": True,
-            })
-            cap.release()
+    with ThreadPoolExecutor(max_workers=len(device_ids)) as executor:
+        results = executor.map(_probe_camera, device_ids)
 
-    return devices
+    devices = [info for info in results if info is not None]
+    _ENUM_CACHE[max_devices] = devices
+    # Hand out a copy so callers cannot mutate the cached list
+    return list(devices)
 
 
 class CameraWorker(QThread):
@@ -48,59 +101,112 @@ class CameraWorker(QThread):
     def __init__(self, source: "CameraSource") -> None:
         super().__init__()
         self._source = source
-        self._running = False
-        self._mutex = QMutex()
+        # Plain bool: attribute reads/writes are atomic under the GIL,
+        # so no mutex handshake is needed in the capture loop. Set
+        # here, not in run(), so a stop() issued before the thread is
+        # scheduled is not overwritten.
+        self._running = True
 
     def run(self) -> None:
         """Main capture loop."""
-        import time
+        # Hoist attribute chains into locals: at 30-60 fps the repeated
+        # lookups are measurable, and none of these change while the
+        # worker runs (close() stops the worker before releasing _cap)
+        source = self._source
+        cap = source._cap
+        ring = source.ring
+        emit_slot = source.FRAME_SLOT_READY.emit
+        emit_frame = source.FRAME_READY.emit
+        emit_error = source.ERROR_OCCURRED.emit
+        update_fps = source._update_fps
+        cvt_color = cv2.cvtColor
+        monotonic = time.monotonic
+        sleep = time.sleep
+
+        grayscale = source._grayscale
+        code = cv2.COLOR_BGR2GRAY if grayscale else cv2.COLOR_BGR2RGB
 
-        self._running = True
         frame_index = 0
-        target_fps = 30.0  # Limit to 30 FPS
-        frame_interval = 1.0 / target_fps
+        next_emit = monotonic()
 
         while self._running:
-            frame_start = time.time()
-
-            with QMutexLocker(self._mutex):
-                if not self._running:
-                    break
-
-            cap = self._source._cap
             if cap is None or not cap.isOpened():
                 break
 
-            ret, frame = cap.read()
+            # grab() advances the stream without decoding. The camera
+            # paces the loop (grab blocks until the next frame), and
+            # the expensive YUV/JPEG decode in retrieve() only runs
+            # for frames that are actually emitted, so sampling below
+            # the camera rate skips the decode on dropped frames.
+            if not cap.grab():
+                emit_error("Failed to read frame from camera")
+                sleep(0.1)  # Wait before retry
+                continue
+
+            now = monotonic()
+            if now < next_emit:
+                continue  # Drop without decoding
+            # Re-read per emit so set_fps() takes effect mid-run
+            next_emit = now + 1.0 / source._target_fps
+
+            ret, frame = cap.retrieve()
 
             if not ret or frame is None:
-                self._source.ERROR_OCCURRED.emit("Failed to read frame from camera")
-                time.sleep(0.1)  # Wait before retry
+                emit_error("Failed to read frame from camera")
+                sleep(0.1)  # Wait before retry
                 continue
 
-            # Convert based on grayscale setting
-            if self._source.grayscale:
-                converted = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            else:
-                converted = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Re-bind conversion params if the user toggled grayscale
+            if source._grayscale != grayscale:
+                grayscale = source._grayscale
+                code = cv2.COLOR_BGR2GRAY if grayscale else cv2.COLOR_BGR2RGB
+
+            try:
+                # Convert straight into a ring slot so no per-frame
+                # buffer is allocated and only the slot index crosses
+                # the thread boundary for zero-copy consumers.
+                ring.configure(frame.shape[:2] if grayscale else frame.shape)
+
+                slot = ring.acquire()
+                if slot is None:
+                    # Consumer is behind; drop the oldest frame
+                    # (latest wins)
+                    ring.drop_oldest()
+                    slot = ring.acquire()
+
+                slot_idx, converted = slot
+                if frame.ndim == 2:
+                    # Driver already delivered Y-only frames (hardware
+                    # grayscale accepted); no color conversion needed
+                    np.copyto(converted, frame)
+                else:
+                    cvt_color(frame, code, dst=converted)
+                ring.commit()
+            except Exception as e:
+                # A driver delivering an unexpected frame layout
+                # mid-stream must not kill the capture thread:
+                # report, back off and retry
+                emit_error(f"Frame conversion failed: {e}")
+                sleep(0.1)
+                continue
 
-            # Emit frame
-            self._source.FRAME_READY.emit(converted, frame_index)
+            # FRAME_SLOT_READY is the zero-copy path: consumers read
+            # via ring.view() and hand the slot back with release().
+            # FRAME_READY consumers never release, so the ring recycles
+            # slots underneath their queued emissions whenever the GUI
+            # lags — they get a private copy instead of the slot.
+            emit_slot(slot_idx, frame_index)
+            legacy = converted.copy()
+            legacy.setflags(write=False)
+            emit_frame(legacy, frame_index)
             frame_index += 1
 
-            # FPS control
-            self._source._update_fps()
-
-            # Limit frame rate to prevent overwhelming the main thread
-            elapsed = time.time() - frame_start
-            sleep_time = frame_interval - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            # FPS control (counts emitted frames, not grabs)
+            update_fps()
 
     def stop(self) -> None:
         """Stop the capture loop."""
-        with QMutexLocker(self._mutex):
-            self._running = False
+        self._running = False
 
 
 class CameraSource(FrameSource):
@@ -109,12 +215,25 @@ class CameraSource(FrameSource):
     Uses OpenCV VideoCapture for camera access.
     Runs capture in a separate thread to avoid UI blocking.
 
+    Captured frames are written into a preallocated FrameRing; the
+    FRAME_SLOT_READY signal carries only the slot index so consumers
+    can read the frame in place via ring.view(slot_idx) and hand it
+    back with ring.release(slot_idx). FRAME_READY is still emitted
+    for consumers that do not use the ring; those frames are private
+    read-only copies, safe to hold after the emission.
+
+    Signals:
+        FRAME_SLOT_READY: Emitted when a new frame is published to the ring.
+            Args: (slot_index: int, frame_index: int)
+
     Example:
         source = CameraSource()
         source.open("0")  # Device ID as string
         source.start()    # Begins emitting FRAME_READY signals
     """
 
+    FRAME_SLOT_READY = pyqtSignal(int, int)
+
     def __init__(self) -> None:
         super().__init__()
         self._cap: Optional[cv2.VideoCapture] = None
@@ -123,6 +242,46 @@ class CameraSource(FrameSource):
         self._frame_count = 0
         self._last_fps_time = 0.0
         self._fps_frame_count = 0
+        self._ring = FrameRing()
+        self._hw_grayscale = False  # Driver delivers Y-only frames
+        self._target_fps = 30.0  # Emit rate; grabs run at camera rate
+        self._static_info: dict = {}  # Properties stable between open/set calls
+        # Bound method avoids the module-attribute lookup per frame;
+        # monotonic is also immune to wall-clock jumps
+        self._monotonic = time.monotonic
+
+    @property
+    def ring(self) -> FrameRing:
+        """Ring buffer holding the captured frames."""
+        return self._ring
+
+    @property
+    def grayscale(self) -> bool:
+        """Whether to convert frames to grayscale."""
+        return self._grayscale
+
+    @grayscale.setter
+    def grayscale(self, value: bool) -> None:
+        """Set grayscale mode, renegotiating the stream format.
+
+        Hardware Y-only delivery is pinned on the capture when
+        grayscale is requested; switching to color must revert it,
+        or the driver would keep sending 2-D frames forever.
+        """
+        if value != self._grayscale:
+            self._cvt_buf = None  # Buffer shape no longer matches
+        self._grayscale = value
+
+        if self._cap is None:
+            return
+        if value:
+            self._hw_grayscale = self._try_hardware_grayscale(self._cap)
+        elif self._hw_grayscale:
+            self._cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+            self._cap.set(
+                cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG")
+            )
+            self._hw_grayscale = False
 
     @property
     def is_live(self) -> bool:
@@ -158,14 +317,83 @@ class CameraSource(FrameSource):
             self.ERROR_OCCURRED.emit(f"Failed to open camera {device_id}")
             return False
 
+        # Pin the stream format before the first read: an explicit
+        # MJPG FourCC skips FFMPEG's format probe (which can stall for
+        # seconds on an unknown stream) and MJPEG sustains far higher
+        # decode throughput than H.264 at capture resolutions.
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        # Re-assert the negotiated resolution explicitly so the first
+        # read does not renegotiate the mode
+        cap.set(
+            cv2.CAP_PROP_FRAME_WIDTH,
+            int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 640,
+        )
+        cap.set(
+            cv2.CAP_PROP_FRAME_HEIGHT,
+            int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 480,
+        )
+
+        # Single-frame driver buffer: the default (4 on V4L2) hands out
+        # frames that are ~100 ms stale at 30 FPS. Not every backend
+        # honors the hint, but the capture loop's continuous grab()
+        # keeps the queue drained regardless.
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        self._hw_grayscale = (
+            self._try_hardware_grayscale(cap) if self._grayscale else False
+        )
+
         self._cap = cap
         self._device_id = device_id
 
         # Get camera properties
         self._fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self._refresh_static_info()
 
         return True
 
+    def _try_hardware_grayscale(self, cap: cv2.VideoCapture) -> bool:
+        """Ask the driver for Y-only frames, skipping cvtColor entirely.
+
+        When the backend accepts a raw GREY pixel format the per-frame
+        BGR->gray conversion (a pure memory-bandwidth cost) disappears;
+        the capture loop detects the 2-D frames and copies them
+        straight into the ring.
+
+        set() return values are not trusted: V4L2 in particular
+        reports success for formats it does not honor, which would
+        leave raw packed bytes being published as frames. A real
+        frame is read back and must be a 2-D buffer of the negotiated
+        height before the mode is kept.
+
+        Args:
+            cap: The opened capture to configure.
+
+        Returns:
+            True if Y-only delivery was verified; on failure the
+            default BGR/MJPG delivery is restored and cvtColor
+            remains in play.
+        """
+        ok = bool(cap.set(cv2.CAP_PROP_CONVERT_RGB, 0))
+        ok = bool(cap.set(
+            cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"GREY")
+        )) and ok
+
+        if ok:
+            ret, frame = cap.read()
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            ok = (
+                bool(ret)
+                and frame is not None
+                and frame.ndim == 2
+                and (height == 0 or frame.shape[0] == height)
+            )
+
+        if not ok:
+            cap.set(cv2.CAP_PROP_CONVERT_RGB, 1)
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+        return ok
+
     def close(self) -> None:
         """Close the camera and release resources."""
         self.stop()
@@ -176,6 +404,8 @@ class CameraSource(FrameSource):
 
         self._device_id = 0
         self._frame_count = 0
+        self._hw_grayscale = False
+        self._static_info = {}
 
     def start(self) -> None:
         """Start capturing frames."""
@@ -191,8 +421,7 @@ class CameraSource(FrameSource):
         self._set_state(SourceState.PLAYING)
 
         # Initialize FPS tracking
-        import time
-        self._last_fps_time = time.time()
+        self._last_fps_time = self._monotonic()
         self._fps_frame_count = 0
 
     def stop(self) -> None:
@@ -226,14 +455,20 @@ class CameraSource(FrameSource):
         if not ret or frame is None:
             return None
 
-        if self._grayscale:
-            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        else:
-            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        if frame.ndim == 2:
+            # Driver already delivered Y-only frames (hardware
+            # grayscale accepted); cvtColor would reject them
+            return frame
+
+        return self._convert_bgr(frame)
 
     def get_camera_info(self) -> dict:
         """Get camera properties.
 
+        Width/height/backend come from a cache refreshed on open() and
+        set_resolution(); only the genuinely dynamic properties
+        (brightness/contrast/exposure) are queried per call.
+
         Returns:
             Dictionary with camera properties.
         """
@@ -242,15 +477,36 @@ class CameraSource(FrameSource):
 
         return {
             "device_id": self._device_id,
-            "width": int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-            "height": int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
             "fps": self._fps,
-            "backend": self._cap.getBackendName(),
+            **self._static_info,
             "brightness": self._cap.get(cv2.CAP_PROP_BRIGHTNESS),
             "contrast": self._cap.get(cv2.CAP_PROP_CONTRAST),
             "exposure": self._cap.get(cv2.CAP_PROP_EXPOSURE),
         }
 
+    def _refresh_static_info(self) -> None:
+        """Re-query the properties that only change on open/set calls."""
+        if self._cap is None:
+            self._static_info = {}
+            return
+
+        self._static_info = {
+            "width": int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "backend": self._cap.getBackendName(),
+        }
+
+    def set_fps(self, fps: float) -> None:
+        """Set the target emit rate.
+
+        The capture loop still grab()s every camera frame to stay
+        current, but only decodes (retrieve) and emits at this rate.
+
+        Args:
+            fps: Target frames per second (clamped to 1-120).
+        """
+        self._target_fps = max(1.0, min(120.0, float(fps)))
+
     def set_resolution(self, width: int, height: int) -> bool:
         """Set camera resolution.
 
@@ -267,11 +523,13 @@ class CameraSource(FrameSource):
         self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
 
-        # Verify
-        actual_width = int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        actual_height = int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        # Verify (and keep the cached info in sync)
+        self._refresh_static_info()
 
-        return actual_width == width and actual_height == height
+        return (
+            self._static_info["width"] == width
+            and self._static_info["height"] == height
+        )
 
     def set_exposure(self, exposure: float) -> bool:
         """Set camera exposure.
@@ -303,10 +561,8 @@ class CameraSource(FrameSource):
 
     def _update_fps(self) -> None:
         """Update FPS calculation."""
-        import time
-
         self._fps_frame_count += 1
-        current_time = time.time()
+        current_time = self._monotonic()
         elapsed = current_time - self._last_fps_time
 
         if elapsed >= 1.0:  # Update every second
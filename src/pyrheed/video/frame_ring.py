@@ -0,0 +1,139 @@
+"""Preallocated frame ring buffer.
+
+Provides a single-producer single-consumer ring of preallocated frame
+slots so that frames can be handed from a capture thread to GUI
+consumers without per-frame allocation or copying. The producer writes
+directly into a slot (e.g. as the ``dst`` of ``cv2.cvtColor``) and only
+an integer slot index crosses the thread boundary.
+"""
+
+import threading
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class FrameRing:
+    """SPSC ring of preallocated frame slots.
+
+    The producer reserves a slot with acquire(), fills it in place and
+    publishes it with commit(). The consumer reads the slot via view()
+    and hands it back with release(). The head counter is written only
+    by the producer and needs no locking under the GIL; the tail
+    counter is advanced from both sides — release() on the consumer
+    thread, drop_oldest() on the producer when the consumer falls
+    behind — so its check-and-increment is guarded by a mutex (a plain
+    += 1 from two threads can lose an increment, permanently leaking a
+    slot and forcing the producer into drop-overwrite on every frame).
+
+    Example:
+        ring = FrameRing(slot_count=8)
+        ring.configure((480, 640))
+        result = ring.acquire()
+        if result is not None:
+            idx, buf = result
+            buf[:] = frame_data
+            ring.commit()
+        frame = ring.view(idx)   # consumer side
+        ring.release(idx)
+    """
+
+    def __init__(self, slot_count: int = 8) -> None:
+        """Initialize the ring.
+
+        Args:
+            slot_count: Number of preallocated frame slots.
+        """
+        self._slot_count = slot_count
+        self._slots: list[NDArray[np.uint8]] = []
+        self._shape: Optional[tuple[int, ...]] = None
+        self._head = 0  # Next sequence number to write (producer only)
+        self._tail = 0  # Oldest unreleased sequence number
+        # Guards _tail: both release() (consumer) and drop_oldest()
+        # (producer) advance it
+        self._tail_lock = threading.Lock()
+
+    @property
+    def slot_count(self) -> int:
+        """Number of slots in the ring."""
+        return self._slot_count
+
+    @property
+    def shape(self) -> Optional[tuple[int, ...]]:
+        """Frame shape the slots are allocated for, or None."""
+        return self._shape
+
+    def configure(self, shape: tuple[int, ...]) -> None:
+        """Allocate slots for a frame shape.
+
+        Reallocates (and resets the ring) only when the shape actually
+        changes, so it is cheap to call per frame.
+
+        Args:
+            shape: Frame shape, e.g. (h, w) or (h, w, 3).
+        """
+        shape = tuple(shape)
+        if shape != self._shape:
+            self._slots = [
+                np.empty(shape, dtype=np.uint8)
+                for _ in range(self._slot_count)
+            ]
+            self._shape = shape
+            with self._tail_lock:
+                self._head = 0
+                self._tail = 0
+
+    def acquire(self) -> Optional[tuple[int, NDArray[np.uint8]]]:
+        """Reserve the next writable slot.
+
+        Returns:
+            (slot_index, buffer) to fill in place, or None if the ring
+            is full (consumer has not released slots yet).
+        """
+        if not self._slots or self._head - self._tail >= self._slot_count:
+            return None
+        idx = self._head % self._slot_count
+        return idx, self._slots[idx]
+
+    def commit(self) -> int:
+        """Publish the slot reserved by the last acquire().
+
+        Returns:
+            The slot index that was published.
+        """
+        idx = self._head % self._slot_count
+        self._head += 1
+        return idx
+
+    def view(self, slot_idx: int) -> NDArray[np.uint8]:
+        """Get a zero-copy view of a published slot.
+
+        Args:
+            slot_idx: Slot index received from the producer.
+
+        Returns:
+            The slot's numpy array (not a copy).
+        """
+        return self._slots[slot_idx]
+
+    def release(self, slot_idx: int) -> None:
+        """Hand a slot back to the producer.
+
+        Slots are released in FIFO order; slot_idx is accepted for
+        symmetry with view().
+
+        Args:
+            slot_idx: Slot index to release.
+        """
+        with self._tail_lock:
+            if self._tail < self._head:
+                self._tail += 1
+
+    def drop_oldest(self) -> None:
+        """Discard the oldest published slot (latest-wins policy).
+
+        Used by live sources when the consumer falls behind: the oldest
+        frame is overwritten rather than stalling the capture loop.
+        """
+        self.release(self._tail % self._slot_count)
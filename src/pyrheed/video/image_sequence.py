@@ -3,26 +3,122 @@
 Loads a sequence of images from a folder for frame-by-frame analysis.
 """
 
+import atexit
+import contextlib
 import os
+import queue
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import cv2
 import numpy as np
 from numpy.typing import NDArray
 from PIL import Image
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import Qt, QThread, QTimer
 
 from pyrheed.video.source import FrameSource, SourceState
 
+try:
+    import tifffile
+except ImportError:  # Optional fast path for memory-mapped TIFF stacks
+    tifffile = None
+
 
 # Supported image formats
 SUPPORTED_EXTENSIONS = {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp"}
 
+# Precompiled, case-insensitive match for a supported extension:
+# one C-level search per directory entry instead of a splitext call,
+# a str.lower allocation, and a set probe
+_EXT_RE = re.compile(
+    r"\.(" + "|".join(ext.lstrip(".") for ext in SUPPORTED_EXTENSIONS) + r")$",
+    re.IGNORECASE,
+)
+
+# Extensions handled by the multi-page stack fast path
+STACK_EXTENSIONS = {".tif", ".tiff"}
+
+# Number of upcoming frames to pre-decode during playback
+PREFETCH_COUNT = 8
+
+# Default disk budget for the whole-sequence decode cube. Sequences
+# whose decoded size would exceed it keep the per-frame decode path;
+# per-source override via ImageSequenceSource.cube_max_bytes.
+_CUBE_MAX_BYTES = 256 * 1024 * 1024
+
+# Backing files of live cubes; swept at interpreter exit so files a
+# crash or missed close() left behind do not accumulate in the temp
+# directory
+_CUBE_TMP_PATHS: set[str] = set()
+
+
+def _cleanup_cube_files() -> None:
+    """Remove any cube backing files still on disk (atexit hook)."""
+    for path in list(_CUBE_TMP_PATHS):
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+
+
+atexit.register(_cleanup_cube_files)
+
+_NATURAL_SORT_RE = re.compile(r"(\d+)")
+
+
+def _natural_key(name: str) -> tuple:
+    """Sort key ordering embedded numbers numerically (frame2 < frame10)."""
+    return tuple(
+        int(part) if part.isdigit() else part.lower()
+        for part in _NATURAL_SORT_RE.split(name)
+    )
+
+
+class PrefetchWorker(QThread):
+    """Background worker that pre-decodes upcoming frames.
+
+    Pulls frame indices from the source's prefetch queue and decodes
+    them into the frame cache, so the playback timer callback is a
+    dict lookup instead of a blocking disk read.
+    """
+
+    def __init__(self, source: "ImageSequenceSource") -> None:
+        super().__init__()
+        self._source = source
+        # Set here, not in run(), so a stop() issued before the thread
+        # is scheduled is not overwritten.
+        self._running = True
+
+    def run(self) -> None:
+        """Main prefetch loop."""
+        while self._running:
+            try:
+                frame_index = self._source._prefetch_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            if frame_index is None:  # Sentinel from stop()
+                break
+
+            # get_frame decodes and caches (no-op on cache hit)
+            self._source.get_frame(frame_index)
+
+    def stop(self) -> None:
+        """Stop the prefetch loop."""
+        self._running = False
+        try:
+            self._source._prefetch_queue.put_nowait(None)
+        except queue.Full:
+            pass
+
 
 class ImageSequenceSource(FrameSource):
     """Frame source that loads images from a folder.
 
-    Images are sorted alphabetically by filename.
+    Images are sorted in natural order by filename (frame2 < frame10).
     Supports PNG, JPG, TIFF, BMP formats.
 
     Example:
@@ -35,29 +131,74 @@ class ImageSequenceSource(FrameSource):
         super().__init__()
         self._image_paths: list[Path] = []
         self._timer = QTimer(self)
+        # Single-shot precise timer, re-armed against an absolute
+        # deadline each frame to avoid cumulative FPS drift
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setSingleShot(True)
         self._timer.timeout.connect(self._on_timer)
-        self._frame_cache: dict[int, NDArray[np.uint8]] = {}
-        self._cache_size = 10  # Number of frames to cache
+        self._stack: Optional[NDArray] = None  # Memory-mapped TIFF stack
+        self._stack_path: Optional[Path] = None
+        self._stack_scale = 1.0  # Global >8-bit -> uint8 quantization
+        # Cache entries are the decoded arrays themselves (or views
+        # into the memmap cube); callers may hold a frame after it is
+        # evicted, so the cache only ever drops references, never
+        # recycles storage
+        self._frame_cache: OrderedDict[tuple, NDArray[np.uint8]] = OrderedDict()
+        self._cache_size = 2 * PREFETCH_COUNT  # Number of frames to cache
+        self._cache_lock = threading.Lock()
+        self._prefetch_queue: queue.Queue = queue.Queue(maxsize=PREFETCH_COUNT)
+        self._prefetch_worker: Optional[PrefetchWorker] = None
+        self._name_index: dict[str, int] = {}
+        # Whole-sequence decode cube: a disk-backed memmap filled in
+        # the background so first-visit seeks anywhere in the folder
+        # become a memcpy instead of a PNG decode
+        self._cube: Optional[np.memmap] = None
+        self._cube_filled: Optional[NDArray[np.bool_]] = None
+        self._cube_path: Optional[str] = None
+        self._cube_thread: Optional[threading.Thread] = None
+        self._cube_abort = False
+        self._cube_grayscale = True
+        # Disk budget for the cube; 0 disables the build entirely
+        self.cube_max_bytes: int = _CUBE_MAX_BYTES
 
     def open(self, path: str) -> bool:
-        """Open a folder containing images.
+        """Open a folder containing images, or a multi-page TIFF stack.
 
         Args:
-            path: Path to folder containing image files.
+            path: Path to folder containing image files, or to a
+                multi-page TIFF file.
 
         Returns:
-            True if folder exists and contains valid images.
+            True if the source contains valid images.
         """
         folder = Path(path)
+
+        # Multi-page TIFF stacks get a memory-mapped fast path
+        if folder.is_file() and folder.suffix.lower() in STACK_EXTENSIONS:
+            return self._open_tiff_stack(folder)
+
         if not folder.is_dir():
             self.ERROR_OCCURRED.emit(f"Not a directory: {path}")
             return False
 
-        # Find all image files
-        self._image_paths = sorted(
-            p for p in folder.iterdir()
-            if p.suffix.lower() in SUPPORTED_EXTENSIONS
-        )
+        self._stack = None
+        self._stack_path = None
+        self._reset_cube()
+
+        # Find all image files. os.scandir avoids the per-entry stat
+        # of Path.iterdir, and the natural sort keeps frame10 after
+        # frame2 for unpadded frame numbers.
+        names = [
+            entry.name
+            for entry in os.scandir(folder)
+            if entry.is_file() and _EXT_RE.search(entry.name)
+        ]
+        names.sort(key=_natural_key)
+        self._image_paths = [folder / name for name in names]
+        # O(1) filename -> index lookup for seek_by_name (a sorted
+        # binary search would be wrong here: names are in natural
+        # order, not lexicographic)
+        self._name_index = {name: i for i, name in enumerate(names)}
 
         if not self._image_paths:
             self.ERROR_OCCURRED.emit(f"No images found in: {path}")
@@ -65,31 +206,109 @@ class ImageSequenceSource(FrameSource):
 
         self._total_frames = len(self._image_paths)
         self._current_frame_index = 0
-        self._frame_cache.clear()
+        with self._cache_lock:
+            self._frame_cache.clear()
+
+        self._start_cube_build()
+
+        return True
+
+    def _open_tiff_stack(self, path: Path) -> bool:
+        """Memory-map a multi-page TIFF stack.
+
+        Uncompressed contiguous stacks are mapped directly, so
+        get_frame becomes an O(1) zero-copy slice with no per-frame
+        decode at all.
+
+        Args:
+            path: Path to the TIFF file.
+
+        Returns:
+            True if the stack was mapped successfully.
+        """
+        if tifffile is None:
+            self.ERROR_OCCURRED.emit(
+                "Multi-page TIFF stacks require the tifffile package"
+            )
+            return False
+
+        try:
+            stack = tifffile.memmap(str(path), mode="r")
+        except (ValueError, OSError) as e:
+            # Compressed or non-contiguous pages cannot be mapped
+            self.ERROR_OCCURRED.emit(f"Cannot memory-map TIFF stack: {e}")
+            return False
+
+        if stack.ndim == 2:
+            stack = stack.reshape((1,) + stack.shape)
+
+        # One quantization scale for the whole stack, anchored to the
+        # stack-global peak: per-frame auto-gain would flatten the
+        # inter-frame intensity oscillations RHEED analysis measures.
+        # The max() pass streams the mapped file once at open.
+        self._stack_scale = 1.0
+        if stack.dtype != np.uint8:
+            peak = int(stack.max())
+            self._stack_scale = 255.0 / peak if peak else 1.0
+
+        self._reset_cube()
+        self._stack = stack
+        self._stack_path = path
+        self._image_paths = []
+        self._name_index = {}
+        self._total_frames = len(stack)
+        self._current_frame_index = 0
+        with self._cache_lock:
+            self._frame_cache.clear()
 
         return True
 
     def close(self) -> None:
         """Close the source and release resources."""
         self.stop()
+        self._reset_cube()
         self._image_paths = []
-        self._frame_cache.clear()
+        self._name_index = {}
+        self._stack = None
+        self._stack_path = None
+        with self._cache_lock:
+            self._frame_cache.clear()
         self._total_frames = 0
         self._current_frame_index = 0
 
     def start(self) -> None:
         """Start playback, emitting frames at configured FPS."""
-        if not self._image_paths:
+        if self._total_frames == 0:
             self.ERROR_OCCURRED.emit("No images loaded. Call open() first.")
             return
 
+        # A memory-mapped stack needs no decoding, hence no prefetcher
+        if self._stack is None:
+            if self._prefetch_worker is None:
+                self._prefetch_worker = PrefetchWorker(self)
+                self._prefetch_worker.start()
+            self._schedule_prefetch()
+
         self._set_state(SourceState.PLAYING)
-        interval_ms = int(1000 / self._fps)
-        self._timer.start(interval_ms)
+        self._start_frame_clock()
+        self._timer.start(self._next_frame_delay_ms())
 
     def stop(self) -> None:
         """Stop playback and reset to first frame."""
         self._timer.stop()
+
+        if self._prefetch_worker is not None:
+            self._prefetch_worker.stop()
+            self._prefetch_worker.wait()  # Wait for thread to finish
+            self._prefetch_worker = None
+
+        # Drain pending prefetch requests
+        while not self._prefetch_queue.empty():
+            try:
+                self._prefetch_queue.get_nowait()
+            except queue.Empty:
+                break
+
         self._current_frame_index = 0
         self._set_state(SourceState.STOPPED)
 
@@ -116,10 +335,27 @@ class ImageSequenceSource(FrameSource):
         # Emit the frame at new position
         frame = self.get_frame(frame_index)
         if frame is not None:
-            self.FRAME_READY.emit(frame, frame_index)
+            self.FRAME_READY.emit(self._readonly_view(frame), frame_index)
 
         return True
 
+    def seek_by_name(self, name: str) -> bool:
+        """Seek to the frame with the given filename.
+
+        Useful when correlating frames with lab-notebook entries that
+        record filenames rather than indices.
+
+        Args:
+            name: Image filename (e.g. "frame_003.png").
+
+        Returns:
+            True if the name exists and the seek succeeded.
+        """
+        index = self._name_index.get(name)
+        if index is None:
+            return False
+        return self.seek(index)
+
     def get_frame(self, frame_index: int) -> Optional[NDArray[np.uint8]]:
         """Get a specific frame by index.
 
@@ -132,19 +368,65 @@ class ImageSequenceSource(FrameSource):
         if not 0 <= frame_index < self._total_frames:
             return None
 
+        if self._stack is not None:
+            return self._stack_frame(frame_index)
+
         # Cache key includes grayscale mode
         cache_key = (frame_index, self._grayscale)
-        if cache_key in self._frame_cache:
-            return self._frame_cache[cache_key]
+        with self._cache_lock:
+            if cache_key in self._frame_cache:
+                return self._frame_cache[cache_key]
 
-        # Load from disk
         try:
-            image_path = self._image_paths[frame_index]
-            img = Image.open(image_path)
+            # Decoded cube first: a memcpy instead of a PNG decode
+            frame = None
+            if (
+                self._cube is not None
+                and self._cube_grayscale == self._grayscale
+                and self._cube_filled[frame_index]
+            ):
+                frame = self._cube[frame_index]
+
+            if frame is None:
+                frame = self._decode_path(
+                    self._image_paths[frame_index], self._grayscale
+                )
+
+            # Cache the frame itself; later cache hits return the
+            # same object
+            with self._cache_lock:
+                self._update_cache(cache_key, frame)
+
+            return frame
+
+        except Exception as e:
+            self.ERROR_OCCURRED.emit(f"Failed to load frame {frame_index}: {e}")
+            return None
 
-            # Convert based on grayscale setting
-            if self._grayscale:
+    @staticmethod
+    def _decode_path(
+        path: Path, grayscale: bool
+    ) -> Optional[NDArray[np.uint8]]:
+        """Decode one image file.
+
+        OpenCV's SIMD decoders are much faster than the PIL path; PIL
+        remains as fallback for formats OpenCV cannot read.
+        """
+        if grayscale:
+            frame = cv2.imread(str(path), cv2.IMREAD_GRAYSCALE)
+        else:
+            bgr = cv2.imread(str(path), cv2.IMREAD_COLOR)
+            frame = None if bgr is None else cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+
+        if frame is None:
+            # Fall back to PIL (e.g. exotic TIFF variants)
+            img = Image.open(path)
+
+            if grayscale:
                 if img.mode != "L":
+                    # Ask the decoder for grayscale directly so
+                    # JPEG chroma channels are never decoded
+                    img.draft("L", img.size)
                     img = img.convert("L")
             else:
                 if img.mode != "RGB":
@@ -152,14 +434,113 @@ class ImageSequenceSource(FrameSource):
 
             frame = np.array(img, dtype=np.uint8)
 
-            # Update cache
-            self._update_cache(cache_key, frame)
+        return frame
 
-            return frame
+    def _start_cube_build(self) -> None:
+        """Kick off background decode of the folder into a cube.
 
-        except Exception as e:
-            self.ERROR_OCCURRED.emit(f"Failed to load frame {frame_index}: {e}")
-            return None
+        The cube is a disk-backed memmap, so thousand-frame sequences
+        spill to disk instead of pinning RAM, bounded by the
+        cube_max_bytes budget. Frames become available incrementally;
+        anything not yet decoded falls back to the regular per-frame
+        path.
+        """
+        self._cube_abort = False
+        self._cube_grayscale = self._grayscale
+        self._cube_thread = threading.Thread(
+            target=self._build_cube, daemon=True
+        )
+        self._cube_thread.start()
+
+    def _build_cube(self) -> None:
+        """Decode every frame into the memmap cube (worker thread)."""
+        paths = self._image_paths
+        grayscale = self._cube_grayscale
+        try:
+            first = self._decode_path(paths[0], grayscale)
+        except Exception:
+            return
+        if first is None:
+            return
+
+        # Respect the disk budget: decoding a long high-resolution
+        # sequence can amount to gigabytes, which would silently fill
+        # the temp partition on every open
+        if len(paths) * first.nbytes > self.cube_max_bytes:
+            return
+
+        shape = (len(paths),) + first.shape
+        fd, cube_path = tempfile.mkstemp(suffix=".pyrheed-cube")
+        os.close(fd)
+        _CUBE_TMP_PATHS.add(cube_path)
+        try:
+            cube = np.memmap(cube_path, mode="w+", dtype=np.uint8, shape=shape)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(cube_path)
+            _CUBE_TMP_PATHS.discard(cube_path)
+            return
+
+        filled = np.zeros(len(paths), dtype=bool)
+        cube[0] = first
+        filled[0] = True
+
+        # Publish before filling: get_frame checks filled per index,
+        # so partially built cubes are already usable
+        self._cube_filled = filled
+        self._cube_path = cube_path
+        self._cube = cube
+
+        def fill(index: int) -> None:
+            if self._cube_abort:
+                return
+            try:
+                frame = self._decode_path(paths[index], grayscale)
+            except Exception:
+                return
+            # Heterogeneous folders simply leave slots unfilled; those
+            # frames keep the per-frame decode path
+            if frame is not None and frame.shape == first.shape:
+                cube[index] = frame
+                filled[index] = True
+
+        # cv2.imread releases the GIL during the decode, so the fill
+        # scales with core count
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            executor.map(fill, range(1, len(paths)))
+
+    def _reset_cube(self) -> None:
+        """Drop the decoded-frame cube and its backing file."""
+        self._cube_abort = True
+        if self._cube_thread is not None and self._cube_thread.is_alive():
+            self._cube_thread.join()
+        self._cube_thread = None
+        self._cube = None
+        self._cube_filled = None
+        if self._cube_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(self._cube_path)
+            _CUBE_TMP_PATHS.discard(self._cube_path)
+            self._cube_path = None
+
+    def get_frames(
+        self, indices: list[int]
+    ) -> list[Optional[NDArray[np.uint8]]]:
+        """Get multiple frames, decoding in parallel.
+
+        cv2.imread releases the GIL during the libjpeg/libpng work, so
+        batch analysis scans scale with core count instead of paying
+        the serial get_frame cost per frame.
+
+        Args:
+            indices: Frame indices to retrieve.
+
+        Returns:
+            Frames in the same order as indices. Entries are None for
+            invalid indices or failed decodes.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(self.get_frame, indices))
 
     def get_image_path(self, frame_index: int) -> Optional[Path]:
         """Get the file path for a specific frame.
@@ -168,12 +549,35 @@ class ImageSequenceSource(FrameSource):
             frame_index: Frame index.
 
         Returns:
-            Path to the image file, or None if invalid index.
+            Path to the image file (the stack file for TIFF stacks),
+            or None if invalid index.
         """
+        if self._stack is not None:
+            if 0 <= frame_index < self._total_frames:
+                return self._stack_path
+            return None
         if 0 <= frame_index < len(self._image_paths):
             return self._image_paths[frame_index]
         return None
 
+    def _stack_frame(self, frame_index: int) -> NDArray[np.uint8]:
+        """Get a frame from the memory-mapped stack.
+
+        8-bit pages matching the requested mode are returned as O(1)
+        views into the mapped file; anything else is converted.
+        """
+        frame = self._stack[frame_index]
+
+        if frame.ndim == 3 and self._grayscale:
+            frame = cv2.cvtColor(np.ascontiguousarray(frame), cv2.COLOR_RGB2GRAY)
+
+        if frame.dtype != np.uint8:
+            # Quantize 16-bit pages with the stack-global scale so
+            # relative intensities between frames survive
+            frame = cv2.convertScaleAbs(frame, alpha=self._stack_scale)
+
+        return frame
+
     def set_fps(self, fps: float) -> None:
         """Set playback frames per second.
 
@@ -181,18 +585,20 @@ class ImageSequenceSource(FrameSource):
             fps: Target FPS (1-120).
         """
         self._fps = max(1.0, min(120.0, fps))
-
-        # Update timer if playing
-        if self._state == SourceState.PLAYING:
-            interval_ms = int(1000 / self._fps)
-            self._timer.setInterval(interval_ms)
+        # The next timer re-arm picks up the new frame duration
 
     def _on_timer(self) -> None:
         """Timer callback - emit next frame."""
+        # Re-arm first so decode time does not delay the next frame
+        if self._state == SourceState.PLAYING:
+            self._timer.start(self._next_frame_delay_ms())
+
         frame = self.get_frame(self._current_frame_index)
 
         if frame is not None:
-            self.FRAME_READY.emit(frame, self._current_frame_index)
+            self.FRAME_READY.emit(
+                self._readonly_view(frame), self._current_frame_index
+            )
 
         # Advance to next frame
         self._current_frame_index += 1
@@ -201,14 +607,51 @@ class ImageSequenceSource(FrameSource):
         if self._current_frame_index >= self._total_frames:
             self._current_frame_index = 0  # Loop back
 
+        # Keep the prefetcher ahead of playback
+        self._schedule_prefetch()
+
+    def _schedule_prefetch(self) -> None:
+        """Queue the next PREFETCH_COUNT frames for background decoding."""
+        if self._prefetch_worker is None or self._total_frames == 0:
+            return
+
+        for offset in range(PREFETCH_COUNT):
+            frame_index = (self._current_frame_index + offset) % self._total_frames
+            cache_key = (frame_index, self._grayscale)
+            with self._cache_lock:
+                cached = cache_key in self._frame_cache
+            if cached:
+                continue
+            try:
+                self._prefetch_queue.put_nowait(frame_index)
+            except queue.Full:
+                break
+
     def _update_cache(self, cache_key: tuple, frame: NDArray[np.uint8]) -> None:
-        """Update frame cache with LRU eviction."""
-        self._frame_cache[cache_key] = frame
+        """Update frame cache with sliding-window eviction.
+
+        The cache stores the decoded arrays directly — get_frame hands
+        them out, so eviction must only drop the cache's reference,
+        never reuse the storage of a frame a caller may still hold.
+        Insertion order tracks playback order, so the two ends of the
+        OrderedDict are the eviction candidates farthest behind and
+        ahead of the current position; comparing only those keeps
+        eviction O(1).
 
-        # Evict oldest if cache is full
-        if len(self._frame_cache) > self._cache_size:
-            # Remove the key furthest from current position
-            keys = list(self._frame_cache.keys())
-            distances = [abs(k[0] - self._current_frame_index) for k in keys]
-            furthest_idx = distances.index(max(distances))
-            del self._frame_cache[keys[furthest_idx]]
+        Caller must hold _cache_lock.
+        """
+        if cache_key in self._frame_cache:
+            self._frame_cache[cache_key] = frame
+            return
+
+        if len(self._frame_cache) >= self._cache_size:
+            current = self._current_frame_index
+            oldest = next(iter(self._frame_cache))
+            newest = next(reversed(self._frame_cache))
+            if abs(oldest[0] - current) >= abs(newest[0] - current):
+                evicted = oldest
+            else:
+                evicted = newest
+            del self._frame_cache[evicted]
+
+        self._frame_cache[cache_key] = frame
@@ -6,15 +6,31 @@ This module defines the interface for all frame data sources:
 - Camera/CCD input
 """
 
+import time
 from abc import ABCMeta, abstractmethod
 from enum import Enum, auto
 from typing import Optional
 
+import cv2
 import numpy as np
 from numpy.typing import NDArray
 from PyQt6.QtCore import QObject, pyqtSignal
 
 
+# Opt in to OpenCV's T-API so cvtColor on UMat inputs dispatches to an
+# OpenCL device when one is present (transparent no-op otherwise)
+try:
+    _USE_OPENCL = bool(cv2.ocl.haveOpenCL())
+    if _USE_OPENCL:
+        cv2.ocl.setUseOpenCL(True)
+except AttributeError:  # cv2 built without OpenCL support
+    _USE_OPENCL = False
+
+# Frames below this pixel count stay on the CPU: the host<->device
+# round trip costs more than the conversion itself
+_OPENCL_MIN_PIXELS = 2_000_000
+
+
 class SourceState(Enum):
     """State of a frame source."""
     STOPPED = auto()
@@ -56,6 +72,8 @@ class FrameSource(QObject, metaclass=QObjectABCMeta):
         self._total_frames = 0
         self._fps = 30.0
         self._grayscale = True  # Default to grayscale for RHEED
+        self._cvt_buf: Optional[NDArray[np.uint8]] = None
+        self._next_deadline_ns = 0  # Absolute deadline for the next frame
 
     @property
     def grayscale(self) -> bool:
@@ -65,6 +83,8 @@ class FrameSource(QObject, metaclass=QObjectABCMeta):
     @grayscale.setter
     def grayscale(self, value: bool) -> None:
         """Set grayscale mode."""
+        if value != self._grayscale:
+            self._cvt_buf = None  # Buffer shape no longer matches
         self._grayscale = value
 
     @property
@@ -153,3 +173,74 @@ class FrameSource(QObject, metaclass=QObjectABCMeta):
         if self._state != new_state:
             self._state = new_state
             self.STATE_CHANGED.emit(new_state)
+
+    def _start_frame_clock(self) -> None:
+        """Reset the absolute frame deadline to now."""
+        self._next_deadline_ns = time.monotonic_ns()
+
+    def _next_frame_delay_ms(self) -> int:
+        """Advance the frame deadline and return the delay until it.
+
+        Scheduling against an absolute deadline keeps the long-run FPS
+        exact: rounding error or callback lateness in one tick is
+        repaid by the next instead of accumulating as drift.
+
+        Returns:
+            Milliseconds until the next frame is due (>= 0).
+        """
+        self._next_deadline_ns += int(1_000_000_000 / self._fps)
+        delay_ns = self._next_deadline_ns - time.monotonic_ns()
+        return max(0, delay_ns // 1_000_000)
+
+    @staticmethod
+    def _readonly_view(frame: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """Read-only view of a frame for signal emission.
+
+        Emitted frames are views into reused buffers (ring slots,
+        cache blocks, conversion scratch), so sources never copy
+        before emitting. The read-only flag turns accidental consumer
+        mutation into an immediate error instead of silent corruption;
+        consumers that need to write must copy.
+        """
+        view = frame.view()
+        view.setflags(write=False)
+        return view
+
+    def _convert_bgr(self, frame: NDArray[np.uint8]) -> NDArray[np.uint8]:
+        """Convert a BGR decoder frame to grayscale or RGB.
+
+        Both paths write into a preallocated destination buffer
+        (reallocated only when the frame shape changes) so the hot
+        path does not allocate. The RGB swap stays in cvtColor rather
+        than a reversed-stride view: consumers wrap frames in QImage
+        Format_RGB888, which requires a C-contiguous buffer, and a
+        negative channel stride would make that construction fail.
+
+        Args:
+            frame: BGR frame as delivered by OpenCV.
+
+        Returns:
+            Converted C-contiguous frame. The buffer is reused
+            between calls; consumers that keep a frame must copy it.
+        """
+        if not self._grayscale:
+            buf = self._cvt_buf
+            if buf is None or buf.shape != frame.shape:
+                buf = np.empty(frame.shape, dtype=np.uint8)
+                self._cvt_buf = buf
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buf)
+            return buf
+
+        if _USE_OPENCL and frame.shape[0] * frame.shape[1] >= _OPENCL_MIN_PIXELS:
+            # T-API path: the conversion runs on the OpenCL device,
+            # freeing the CPU for acquisition; get() downloads the result
+            return cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2GRAY).get()
+
+        shape = frame.shape[:2]
+        buf = self._cvt_buf
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.uint8)
+            self._cvt_buf = buf
+
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=buf)
+        return buf
@@ -3,13 +3,14 @@
 Loads video files (mp4, avi, etc.) using OpenCV for frame-by-frame analysis.
 """
 
+import struct
 from pathlib import Path
 from typing import Optional
 
 import cv2
 import numpy as np
 from numpy.typing import NDArray
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import Qt, QTimer
 
 from pyrheed.video.source import FrameSource, SourceState
 
@@ -17,6 +18,18 @@ from pyrheed.video.source import FrameSource, SourceState
 # Supported video formats
 SUPPORTED_EXTENSIONS = {".mp4", ".avi", ".mov", ".mkv", ".wmv", ".flv", ".webm"}
 
+# Forward jumps smaller than this are done by skipping frames with
+# grab() instead of an expensive keyframe re-seek.
+_GRAB_SEEK_THRESHOLD = 8
+
+# Ask FFmpeg for hardware decode (CUVID/VA-API/MediaFoundation);
+# VIDEO_ACCELERATION_ANY falls back to software decode on its own.
+# OpenCV < 4.5 lacks the property, hence the feature check.
+if hasattr(cv2, "VIDEO_ACCELERATION_ANY"):
+    _HW_ACCEL_PARAMS = [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+else:
+    _HW_ACCEL_PARAMS = []
+
 
 class VideoFileSource(FrameSource):
     """Frame source that loads video files.
@@ -35,7 +48,13 @@ class VideoFileSource(FrameSource):
         self._cap: Optional[cv2.VideoCapture] = None
         self._video_path: Optional[Path] = None
         self._timer = QTimer(self)
+        # Single-shot precise timer, re-armed against an absolute
+        # deadline each frame to avoid cumulative FPS drift
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setSingleShot(True)
         self._timer.timeout.connect(self._on_timer)
+        self._decoder_pos = 0  # Cached decoder position (next frame to decode)
+        self._static_info: dict = {}  # Properties immutable after open()
 
     def open(self, path: str) -> bool:
         """Open a video file.
@@ -59,8 +78,13 @@ class VideoFileSource(FrameSource):
             )
             return False
 
-        # Open with OpenCV
-        cap = cv2.VideoCapture(str(video_path))
+        # Open with OpenCV, preferring FFmpeg with hardware decode so
+        # H.264/HEVC playback does not burn CPU in _on_timer
+        cap = cv2.VideoCapture(str(video_path), cv2.CAP_FFMPEG, _HW_ACCEL_PARAMS)
+
+        if not cap.isOpened():
+            # Retry with the default backend (e.g. builds without FFmpeg)
+            cap = cv2.VideoCapture(str(video_path))
 
         if not cap.isOpened():
             self.ERROR_OCCURRED.emit(f"Failed to open video: {path}")
@@ -70,6 +94,11 @@ class VideoFileSource(FrameSource):
         if self._cap is not None:
             self._cap.release()
 
+        # Hold a single frame in the decoder queue: extra read-ahead
+        # buffering only adds open-time memory and seek latency for a
+        # random-access source (best-effort, not every backend honors it)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
         self._cap = cap
         self._video_path = video_path
 
@@ -77,6 +106,15 @@ class VideoFileSource(FrameSource):
         self._total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         self._fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
         self._current_frame_index = 0
+        self._decoder_pos = 0
+
+        # Cache properties that cannot change after open: the UI polls
+        # get_video_info and each cap.get crosses into C per property
+        self._static_info = {
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "codec": self._get_codec(),
+        }
 
         return True
 
@@ -91,6 +129,8 @@ class VideoFileSource(FrameSource):
         self._video_path = None
         self._total_frames = 0
         self._current_frame_index = 0
+        self._decoder_pos = 0
+        self._static_info = {}
 
     def start(self) -> None:
         """Start playback, emitting frames at video's FPS."""
@@ -99,8 +139,8 @@ class VideoFileSource(FrameSource):
             return
 
         self._set_state(SourceState.PLAYING)
-        interval_ms = int(1000 / self._fps)
-        self._timer.start(interval_ms)
+        self._start_frame_clock()
+        self._timer.start(self._next_frame_delay_ms())
 
     def stop(self) -> None:
         """Stop playback and reset to first frame."""
@@ -110,6 +150,7 @@ class VideoFileSource(FrameSource):
         # Seek to beginning
         if self._cap is not None:
             self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self._decoder_pos = 0
 
         self._set_state(SourceState.STOPPED)
 
@@ -134,14 +175,12 @@ class VideoFileSource(FrameSource):
         if not 0 <= frame_index < self._total_frames:
             return False
 
-        # OpenCV seek
-        self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
         self._current_frame_index = frame_index
 
-        # Emit the frame at new position
+        # Emit the frame at new position (get_frame seeks as needed)
         frame = self.get_frame(frame_index)
         if frame is not None:
-            self.FRAME_READY.emit(frame, frame_index)
+            self.FRAME_READY.emit(self._readonly_view(frame), frame_index)
 
         return True
 
@@ -160,21 +199,26 @@ class VideoFileSource(FrameSource):
         if not 0 <= frame_index < self._total_frames:
             return None
 
-        # Seek if needed
-        current_pos = int(self._cap.get(cv2.CAP_PROP_POS_FRAMES))
-        if current_pos != frame_index:
+        # Use the cached decoder position instead of querying
+        # CAP_PROP_POS_FRAMES: small forward jumps are done by skipping
+        # frames with grab(), only large or backward jumps pay for a
+        # real keyframe re-seek.
+        delta = frame_index - self._decoder_pos
+        if not 0 <= delta < _GRAB_SEEK_THRESHOLD:
             self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        else:
+            for _ in range(delta):
+                self._cap.grab()
 
         ret, frame = self._cap.read()
 
         if not ret or frame is None:
+            # Decoder position is now unknown; force a seek next time
+            self._decoder_pos = -_GRAB_SEEK_THRESHOLD
             return None
 
-        # Convert based on grayscale setting
-        if self._grayscale:
-            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        else:
-            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self._decoder_pos = frame_index + 1
+        return self._convert_bgr(frame)
 
     def get_video_info(self) -> dict:
         """Get video metadata.
@@ -189,10 +233,8 @@ class VideoFileSource(FrameSource):
             "path": str(self._video_path) if self._video_path else None,
             "total_frames": self._total_frames,
             "fps": self._fps,
-            "width": int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-            "height": int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
             "duration_sec": self._total_frames / self._fps if self._fps > 0 else 0,
-            "codec": self._get_codec(),
+            **self._static_info,
         }
 
     def set_fps(self, fps: float) -> None:
@@ -202,13 +244,14 @@ class VideoFileSource(FrameSource):
             fps: Target FPS (1-120).
         """
         self._fps = max(1.0, min(120.0, fps))
-
-        if self._state == SourceState.PLAYING:
-            interval_ms = int(1000 / self._fps)
-            self._timer.setInterval(interval_ms)
+        # The next timer re-arm picks up the new frame duration
 
     def _on_timer(self) -> None:
         """Timer callback - read and emit next frame."""
+        # Re-arm first so decode time does not delay the next frame
+        if self._state == SourceState.PLAYING:
+            self._timer.start(self._next_frame_delay_ms())
+
         if self._cap is None:
             return
 
@@ -218,15 +261,17 @@ class VideoFileSource(FrameSource):
             # End of video - loop back
             self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
             self._current_frame_index = 0
+            self._decoder_pos = 0
             return
 
-        # Convert based on grayscale setting
-        if self._grayscale:
-            converted = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        else:
-            converted = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self._decoder_pos += 1
+
+        # Convert based on grayscale setting (reuses preallocated buffer)
+        converted = self._convert_bgr(frame)
 
-        self.FRAME_READY.emit(converted, self._current_frame_index)
+        self.FRAME_READY.emit(
+            self._readonly_view(converted), self._current_frame_index
+        )
         self._current_frame_index += 1
 
     def _get_codec(self) -> str:
@@ -235,5 +280,7 @@ class VideoFileSource(FrameSource):
             return ""
 
         fourcc = int(self._cap.get(cv2.CAP_PROP_FOURCC))
-        # Convert int to 4-char string
-        return "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)])
+        # Little-endian fourcc int -> 4-char string in one shot
+        return struct.pack("<I", fourcc & 0xFFFFFFFF).decode(
+            "ascii", errors="replace"
+        )
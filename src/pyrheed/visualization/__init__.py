@@ -5,12 +5,14 @@ Provides heatmap, 3D surface, and contour visualizations.
 
 from pyrheed.visualization.intensity_view import (
     IntensityHeatmap,
+    IntensityHeatmapQImage,
     IntensityContour,
     IntensitySurface,
 )
 
 __all__ = [
     "IntensityHeatmap",
+    "IntensityHeatmapQImage",
     "IntensityContour",
     "IntensitySurface",
 ]
@@ -6,6 +6,7 @@ Provides different visualization methods for image intensity distribution:
 - Surface: 3D surface plot
 """
 
+import functools
 from typing import Optional
 
 import numpy as np
@@ -19,10 +20,452 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (
+    Q_ARG,
+    QMetaObject,
+    QObject,
+    Qt,
+    QThread,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import QImage, QPixmap, qRgb
+
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the numpy path remains
+    _HAVE_NUMBA = False
+
+try:
+    import cv2
+    _HAVE_CV2 = True
+except ImportError:  # OpenCV is optional; the numpy path remains
+    _HAVE_CV2 = False
+
+try:
+    import pyqtgraph.opengl as gl
+    _HAVE_GL = True
+except ImportError:  # pyqtgraph/PyOpenGL optional; matplotlib remains
+    _HAVE_GL = False
+
+
+# Opt into OpenCL for the T-API conversions below, mirroring the
+# video-source offload: only frames at least this large go through a
+# UMat, since upload/download overhead dominates on small ones
+_OPENCL_MIN_PIXELS = 2_000_000
+_USE_OPENCL = False
+if _HAVE_CV2:
+    try:
+        _USE_OPENCL = cv2.ocl.haveOpenCL()
+        if _USE_OPENCL:
+            cv2.ocl.setUseOpenCL(True)
+    except AttributeError:  # Builds without the ocl module
+        _USE_OPENCL = False
+
+
+# ITU-R BT.601 luma coefficients, allocated once at import so every
+# per-frame conversion shares the same typed array
+_LUMA_COEFFS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+if _HAVE_NUMBA:
+
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True)
+    def _gray_norm_rgb(frame, out):  # pragma: no cover - compiled
+        """Fused RGB->gray conversion + normalization.
+
+        One parallel read pass computes the luma and the running max,
+        a second parallel pass scales in place — versus the separate
+        cast / max / divide passes of the numpy path. nogil lets
+        capture/decode threads keep running while the kernel executes.
+        """
+        h, w = out.shape
+        max_val = np.float32(0.0)
+        for i in prange(h):
+            for j in range(w):
+                g = (
+                    np.float32(0.299) * frame[i, j, 0]
+                    + np.float32(0.587) * frame[i, j, 1]
+                    + np.float32(0.114) * frame[i, j, 2]
+                )
+                out[i, j] = g
+                max_val = max(max_val, g)
+        if max_val > 0.0:
+            inv = np.float32(1.0) / max_val
+            for i in prange(h):
+                for j in range(w):
+                    out[i, j] *= inv
+
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True)
+    def _gray_norm_mono(frame, out):  # pragma: no cover - compiled
+        """Fused cast + normalization for 2-D (mono) frames.
+
+        One pass widens to float32 while tracking the max, one pass
+        scales in place — versus copyto / max / multiply in numpy.
+        """
+        h, w = out.shape
+        max_val = np.float32(0.0)
+        for i in prange(h):
+            for j in range(w):
+                g = np.float32(frame[i, j])
+                out[i, j] = g
+                max_val = max(max_val, g)
+        if max_val > 0.0:
+            inv = np.float32(1.0) / max_val
+            for i in prange(h):
+                for j in range(w):
+                    out[i, j] *= inv
+
+
+@functools.lru_cache(maxsize=16)
+def _downsample_params(
+    h: int, w: int, max_size: int
+) -> tuple[tuple[int, int], tuple[int, int]]:
+    """Reduction parameters for a frame shape, memoized.
+
+    Camera resolution is fixed in practice, so the scale arithmetic
+    is computed once per (h, w, max_size) instead of every frame.
+
+    Returns:
+        ((new_w, new_h), (step_h, step_w)): resize target for the
+        cv2 path and decimation strides for the fallback.
+    """
+    scale = max_size / max(h, w)
+    new_w = max(1, int(w * scale))
+    new_h = max(1, int(h * scale))
+    step_h = max(1, h // max_size)
+    step_w = max(1, w // max_size)
+    return (new_w, new_h), (step_h, step_w)
+
+
+def _block_mean(
+    arr: NDArray, block_h: int, block_w: int
+) -> NDArray[np.float32]:
+    """Average non-overlapping block_h x block_w tiles of an image.
+
+    A strided view groups the pixels of each tile without copying;
+    the mean reduction is then the only pass over the data. Gives
+    INTER_AREA-quality reduction for the fallback path where cv2
+    cannot take the buffer, instead of alias-prone decimation.
+
+    Args:
+        arr: 2-D or 3-D (H, W[, C]) image array.
+        block_h: Tile height (rows averaged together).
+        block_w: Tile width (columns averaged together).
+
+    Returns:
+        float32 array of shape (H//block_h, W//block_w[, C]).
+    """
+    h = arr.shape[0] // block_h * block_h
+    w = arr.shape[1] // block_w * block_w
+    arr = arr[:h, :w]
+
+    tile_shape = (h // block_h, w // block_w, block_h, block_w)
+    tile_strides = (
+        arr.strides[0] * block_h,
+        arr.strides[1] * block_w,
+        arr.strides[0],
+        arr.strides[1],
+    )
+    if arr.ndim == 3:
+        tile_shape += (arr.shape[2],)
+        tile_strides += (arr.strides[2],)
+
+    tiles = np.lib.stride_tricks.as_strided(
+        arr, shape=tile_shape, strides=tile_strides
+    )
+    return tiles.mean(axis=(2, 3), dtype=np.float32)
+
+
+def _cvt_gray_u8(
+    frame: NDArray[np.uint8],
+    out: Optional[NDArray[np.uint8]] = None,
+) -> NDArray[np.uint8]:
+    """RGB uint8 -> gray uint8 via cv2, offloading big frames to GPU.
+
+    Frames above the OpenCL threshold run the conversion through the
+    T-API (UMat) on the GPU when a device is available; smaller ones
+    use the plain SIMD kernel, writing into out when given.
+    """
+    if (
+        _USE_OPENCL
+        and frame.shape[0] * frame.shape[1] >= _OPENCL_MIN_PIXELS
+    ):
+        return cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_RGB2GRAY).get()
+    if out is not None:
+        return cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY, dst=out)
+    return cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+
+
+def _downsample(frame: NDArray[np.uint8], max_size: int) -> NDArray[np.uint8]:
+    """Reduce a frame so neither side exceeds max_size.
+
+    Prefers cv2.resize with INTER_AREA — SIMD block averaging with
+    good cache tiling and no aliasing — over the strided decimation
+    fallback, whose large-stride gathers read every source cache line
+    anyway.
+
+    Args:
+        frame: Grayscale or RGB image array.
+        max_size: Upper bound for both output dimensions.
+
+    Returns:
+        The downsampled frame (the input itself when small enough).
+    """
+    h, w = frame.shape[:2]
+    if h <= max_size and w <= max_size:
+        return frame
+
+    size, steps = _downsample_params(h, w, max_size)
+
+    if _HAVE_CV2 and frame.flags["C_CONTIGUOUS"]:
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+    return _block_mean(frame, steps[0], steps[1])
+
+
+def _to_gray(
+    frame: NDArray[np.uint8],
+    out: Optional[NDArray[np.float32]] = None,
+) -> NDArray[np.float32]:
+    """Convert a frame to float32 grayscale without normalizing.
+
+    Used where the consumer can normalize for free (e.g. matplotlib
+    set_clim), saving the O(N) divide pass of _to_gray_normalized.
+
+    Args:
+        frame: Grayscale or RGB image array.
+        out: Optional float32 buffer to write into, reused across
+            frames. Reallocated when the frame shape changes.
+
+    Returns:
+        2D float32 grayscale array. When the input is already 2-D
+        float32 it is returned as-is (no copy); callers must treat
+        the result as read-only and must not cache it as their
+        reusable buffer.
+    """
+    if frame.ndim == 2 and frame.dtype == np.float32:
+        return frame
+
+    shape = frame.shape[:2]
+    if out is None or out.shape != shape:
+        out = np.empty(shape, dtype=np.float32)
+
+    if (
+        _HAVE_CV2
+        and frame.ndim == 3
+        and frame.dtype == np.uint8
+        and frame.flags["C_CONTIGUOUS"]
+    ):
+        # cvtColor applies the same BT.601 weights in SIMD on packed
+        # uint8, skipping the float32 upcast of the matmul path
+        np.copyto(out, _cvt_gray_u8(frame), casting="unsafe")
+    elif frame.ndim == 3:
+        np.dot(
+            frame.reshape(-1, 3).astype(np.float32, copy=False),
+            _LUMA_COEFFS,
+            out=out.reshape(-1),
+        )
+    else:
+        np.copyto(out, frame, casting="unsafe")
+    return out
+
+
+def _to_gray_normalized(
+    frame: NDArray[np.uint8],
+    out: Optional[NDArray[np.float32]] = None,
+) -> NDArray[np.float32]:
+    """Convert a frame to float32 grayscale normalized to [0, 1].
+
+    Dispatches to the fused Numba kernel when numba is installed;
+    otherwise RGB input is reduced with a single matrix-vector
+    product against the cached luma coefficients (one memory-bound
+    pass instead of three channelwise broadcasts) followed by an
+    in-place scale.
+
+    Args:
+        frame: Grayscale or RGB image array.
+        out: Optional float32 buffer to write into, reused across
+            frames to avoid per-frame allocation. Reallocated when
+            the frame shape changes.
+
+    Returns:
+        2D float32 array scaled to [0, 1]. Callers should keep the
+        returned buffer and pass it back as out on the next frame.
+    """
+    shape = frame.shape[:2]
+    if out is None or out.shape != shape:
+        out = np.empty(shape, dtype=np.float32)
+
+    if frame.ndim == 2 and frame.dtype == np.float32:
+        # Already the target format: fuse the copy and the scale into
+        # the single pass that writes the output buffer
+        max_val = frame.max()
+        if max_val > 0:
+            np.multiply(frame, np.float32(1.0 / max_val), out=out)
+        else:
+            np.copyto(out, frame)
+        return out
+
+    if _HAVE_NUMBA and frame.ndim == 3 and frame.dtype == np.uint8:
+        _gray_norm_rgb(frame, out)
+        return out
+
+    if _HAVE_NUMBA and frame.ndim == 2:
+        _gray_norm_mono(frame, out)
+        return out
+
+    if (
+        _HAVE_CV2
+        and frame.ndim == 3
+        and frame.dtype == np.uint8
+        and frame.flags["C_CONTIGUOUS"]
+    ):
+        np.copyto(out, _cvt_gray_u8(frame), casting="unsafe")
+    elif frame.ndim == 3:
+        np.dot(
+            frame.reshape(-1, 3).astype(np.float32, copy=False),
+            _LUMA_COEFFS,
+            out=out.reshape(-1),
+        )
+    else:
+        np.copyto(out, frame, casting="unsafe")
+
+    max_val = out.max()
+    if max_val > 0:
+        np.multiply(out, np.float32(1.0 / max_val), out=out)
+    return out
+
+
+class _GrayWorker(QObject):
+    """Runs a widget's CPU-side frame conversion on a worker thread.
+
+    The GUI thread posts frames through a queued invocation of
+    process(); the converted result travels back through FRAME_READY
+    (also queued), so only the artist update and blit run on the GUI
+    thread and conversion overlaps with painting.
+    """
+
+    FRAME_READY = pyqtSignal(object)
+
+    def __init__(self, convert) -> None:
+        super().__init__()
+        self._convert = convert
 
+    @pyqtSlot(object)
+    def process(self, frame: NDArray[np.uint8]) -> None:
+        """Convert a frame and emit the result (worker thread only)."""
+        self.FRAME_READY.emit(self._convert(frame))
+
+
+class _RedrawThrottle:
+    """Mixin coalescing rapid update_frame calls into throttled redraws.
+
+    A producer (camera, video playback) may push frames faster than
+    the Qt paint loop can render them. Only the most recent frame is
+    kept; a single-shot timer triggers one actual redraw per interval,
+    so stale frames are dropped and CPU usage stays bounded regardless
+    of the input FPS.
+
+    Widgets call _init_throttle() in __init__ and implement
+    _do_redraw(frame) with the actual rendering.
+    """
+
+    _REDRAW_INTERVAL_MS = 33  # ~30 Hz render cap
+
+    def _init_throttle(self) -> None:
+        """Set up the pending-frame slot and the redraw timer."""
+        self._pending_frame: Optional[NDArray[np.uint8]] = None
+        self._last_frame: Optional[NDArray[np.uint8]] = None
+        self._worker: Optional[_GrayWorker] = None
+        self._worker_thread: Optional[QThread] = None
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(self._REDRAW_INTERVAL_MS)
+        self._redraw_timer.timeout.connect(self._flush_pending)
+
+    def _init_worker(self, convert, present) -> None:
+        """Move the conversion half of the redraw to its own thread.
+
+        Widgets whose _do_redraw splits into a pure-CPU convert step
+        and a GUI-only present step call this after _init_throttle();
+        _flush_pending then posts frames to the worker so conversion
+        and painting overlap instead of serializing on the GUI thread.
+        """
+        self._worker_thread = QThread(self)
+        self._worker = _GrayWorker(convert)
+        self._worker.moveToThread(self._worker_thread)
+        self._worker.FRAME_READY.connect(present)
+        self._worker_thread.start()
+
+    def _stop_worker(self) -> None:
+        """Shut the conversion thread down (call from closeEvent)."""
+        if self._worker_thread is not None:
+            self._worker_thread.quit()
+            self._worker_thread.wait()
+            self._worker_thread = None
+            self._worker = None
+
+    def update_frame(self, frame: NDArray[np.uint8]) -> None:
+        """Queue a frame for display.
 
-class IntensityHeatmap(QWidget):
+        Calls arriving faster than the render cap are coalesced:
+        only the latest frame is rendered when the timer fires.
+
+        Args:
+            frame: Grayscale or RGB image array.
+        """
+        self._pending_frame = frame
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _cancel_pending(self) -> None:
+        """Drop any queued frame (used by clear())."""
+        self._pending_frame = None
+        self._last_frame = None  # Cleared display: next frame must draw
+        self._redraw_timer.stop()
+
+    def _flush_pending(self) -> None:
+        """Timer callback - render the most recent pending frame."""
+        frame = self._pending_frame
+        if frame is None:
+            return
+        self._pending_frame = None
+
+        # Skip frames identical to the last one rendered (common when
+        # the beam is parked) before paying for any conversion or
+        # matplotlib work. The comparison is exact — a sampled digest
+        # would freeze the display for changes confined to off-grid
+        # pixels — and array_equal bails on the first differing byte.
+        last = self._last_frame
+        same_layout = (
+            last is not None
+            and last.shape == frame.shape
+            and last.dtype == frame.dtype
+        )
+        if same_layout and np.array_equal(last, frame):
+            return
+        # Keep a private copy for the next comparison: emitted frames
+        # are views into buffers the producer reuses
+        if same_layout:
+            np.copyto(last, frame)
+        else:
+            self._last_frame = frame.copy()
+
+        if self._worker is not None:
+            QMetaObject.invokeMethod(
+                self._worker, "process",
+                Qt.ConnectionType.QueuedConnection,
+                Q_ARG(object, frame),
+            )
+            return
+        self._do_redraw(frame)
+
+
+class IntensityHeatmap(QWidget, _RedrawThrottle):
     """Heatmap visualization of image intensity.
 
     Displays the current frame as a color-coded heatmap where
@@ -59,6 +502,21 @@ class IntensityHeatmap(QWidget):
         self._image = None
         self._colorbar = None
         self._cmap = "viridis"
+        # Two-slot scratch buffers: the worker converts into one slot
+        # while the GUI thread may still be painting from the other
+        self._gray_bufs: list[Optional[NDArray[np.float32]]] = [None, None]
+        self._u8_bufs: list[Optional[NDArray[np.uint8]]] = [None, None]
+        self._buf_idx = 0
+        # Blit machinery: cached axes background (everything except
+        # the image artist) and the clim it was rendered with
+        self._bg = None
+        self._clim_max: Optional[float] = None
+        # Qt issues full draws on expose/resize/show; recapture the
+        # background and repaint the animated artist afterwards or
+        # the image would stay blank until the next frame arrives
+        self._canvas.mpl_connect("draw_event", self._on_draw)
+        self._init_throttle()
+        self._init_worker(self._convert_frame, self._present)
 
         # 暗色主题样式（不设置标题，因为已经用 QLabel 了）
         self._ax.tick_params(colors='#9B9A97', which='both')
@@ -72,53 +530,240 @@ class IntensityHeatmap(QWidget):
         self._cmap = cmap
         if self._image is not None:
             self._image.set_cmap(cmap)
-            self._canvas.draw_idle()
+            self._bg = None  # Colorbar colors changed
+            self._blit_image()
 
-    def update_frame(self, frame: NDArray[np.uint8]) -> None:
-        """Update with new frame data.
+    def _do_redraw(self, frame: NDArray[np.uint8]) -> None:
+        """Render a frame synchronously (worker path bypasses this).
 
         Args:
             frame: Grayscale or RGB image array.
         """
-        # Convert to grayscale if needed
-        if frame.ndim == 3:
-            gray = (
-                0.299 * frame[:, :, 0] +
-                0.587 * frame[:, :, 1] +
-                0.114 * frame[:, :, 2]
-            ).astype(np.float32)
-        else:
-            gray = frame.astype(np.float32)
+        self._present(self._convert_frame(frame))
 
-        # Normalize to 0-1
-        max_val = np.max(gray)
-        if max_val > 0:
-            gray = gray / max_val
+    def _convert_frame(
+        self, frame: NDArray[np.uint8]
+    ) -> tuple[NDArray, float]:
+        """CPU half of the redraw: grayscale conversion and range.
+
+        Runs on the worker thread; touches only the scratch buffers
+        (alternating between the two slots so the slot the GUI thread
+        is painting from is never overwritten), never the figure.
+
+        Returns:
+            (gray, max_val) ready for _present().
+        """
+        self._buf_idx ^= 1
+        idx = self._buf_idx
+
+        # No Python-side normalization: matplotlib applies the norm
+        # during colormap lookup, so set_clim replaces a full-array
+        # divide per frame.
+        if frame.ndim == 2 and frame.dtype == np.uint8:
+            # Mono cameras: the colormap consumes uint8 directly and
+            # the range is known a priori, so skip the float32 copy
+            # and the max scan entirely
+            return frame, 255.0
+        if (
+            _HAVE_CV2
+            and frame.ndim == 3
+            and frame.dtype == np.uint8
+            and frame.flags["C_CONTIGUOUS"]
+        ):
+            # Stay in uint8 end-to-end: the colormap LUT consumes it
+            # directly and matplotlib copies a quarter of the bytes a
+            # float32 buffer would cost
+            buf = self._u8_bufs[idx]
+            if buf is None or buf.shape != frame.shape[:2]:
+                buf = self._u8_bufs[idx] = np.empty(
+                    frame.shape[:2], dtype=np.uint8
+                )
+            return _cvt_gray_u8(frame, buf), 255.0
+        if frame.ndim == 2 and frame.dtype == np.float32:
+            # Already the format imshow needs; skip the copy and use
+            # it read-only (it is not cached as the reuse buffer)
+            max_val = float(frame.max())
+            return frame, max_val if max_val > 0 else 1.0
+
+        gray = self._gray_bufs[idx] = _to_gray(frame, self._gray_bufs[idx])
+        if frame.dtype == np.uint8:
+            # Luma weights sum to 1, so uint8 input is bounded by
+            # 255 a priori — no O(N) max scan needed
+            return gray, 255.0
+        max_val = float(gray.max())
+        return gray, max_val if max_val > 0 else 1.0
+
+    def _present(self, result: tuple[NDArray, float]) -> None:
+        """GUI half of the redraw: artist update and blit only."""
+        gray, max_val = result
 
         if self._image is None:
             self._image = self._ax.imshow(
-                gray, cmap=self._cmap, vmin=0, vmax=1,
+                gray, cmap=self._cmap, vmin=0, vmax=max_val,
                 aspect="equal", interpolation="nearest"
             )
+            # Animated: excluded from full draws so the blit
+            # background can be captured without the image
+            self._image.set_animated(True)
+            self._clim_max = max_val
             self._colorbar = self._figure.colorbar(self._image, ax=self._ax)
-            self._colorbar.set_label("Normalized Intensity", color='#B4B3AF')
+            self._colorbar.set_label("Intensity", color='#B4B3AF')
             self._colorbar.ax.tick_params(colors='#9B9A97')
             for spine in self._colorbar.ax.spines.values():
                 spine.set_color('#4F5458')
         else:
             self._image.set_data(gray)
+            # Hysteresis: a clim change invalidates the blit background
+            # and forces a full draw, so only rescale when the frame
+            # max drifts more than 5% from the rendered range. Smaller
+            # fluctuations are visually indistinguishable.
+            if (
+                self._clim_max is None
+                or abs(max_val - self._clim_max) > 0.05 * self._clim_max
+            ):
+                self._image.set_clim(0, max_val)
+                self._clim_max = max_val
+                self._bg = None
+
+        self._blit_image()
+
+    def _blit_image(self) -> None:
+        """Redraw only the image artist over the cached background.
+
+        Ticks, spines and the colorbar are static between frames, so
+        restoring the captured background and drawing just the image
+        skips most of matplotlib's per-frame draw cost.
+        """
+        if self._bg is None:
+            # Full draw: _on_draw recaptures the background and
+            # paints the animated artist as part of the draw
+            self._canvas.draw()
+            return
+        self._canvas.restore_region(self._bg)
+        self._ax.draw_artist(self._image)
+        self._canvas.blit(self._ax.bbox)
+
+    def _on_draw(self, event) -> None:
+        """Recapture the blit background after any full canvas draw.
+
+        Fires for our own draw() calls and for the full redraws Qt
+        triggers on expose/resize/show; the animated image artist is
+        excluded from those, so it is repainted here on top of the
+        freshly captured background.
+        """
+        self._bg = self._canvas.copy_from_bbox(self._ax.bbox)
+        if self._image is not None:
+            self._ax.draw_artist(self._image)
 
-        self._canvas.draw_idle()
+    def resizeEvent(self, event) -> None:
+        """Invalidate the blit background when the canvas resizes."""
+        self._bg = None
+        super().resizeEvent(event)
+
+    def closeEvent(self, event) -> None:
+        """Stop the conversion thread before the widget goes away."""
+        self._stop_worker()
+        super().closeEvent(event)
 
     def clear(self) -> None:
         """Clear the display."""
+        self._cancel_pending()
         self._ax.clear()
         self._image = None
         self._colorbar = None
+        self._bg = None
+        self._clim_max = None
         self._canvas.draw_idle()
 
 
-class IntensityContour(QWidget):
+class IntensityHeatmapQImage(QWidget, _RedrawThrottle):
+    """LUT-based heatmap rendered through Qt's indexed-8 path.
+
+    Bypasses matplotlib entirely: the colormap is baked into a
+    256-entry color table that QImage applies during conversion, so a
+    frame update costs one uint8 pass plus a pixmap swap — no
+    Normalize, no Agg composite. Intended for raw-throughput
+    monitoring; unlike IntensityHeatmap it has no axes or colorbar.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        self._title_label = QLabel("Intensity Heatmap")
+        self._title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._title_label.setStyleSheet("""
+            QLabel {
+                color: #B4B3AF;
+                font-size: 16px;
+                padding: 8px 0;
+                background-color: transparent;
+            }
+        """)
+        layout.addWidget(self._title_label)
+
+        self._image_label = QLabel()
+        self._image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._image_label.setStyleSheet("background-color: #252729;")
+        layout.addWidget(self._image_label, stretch=1)
+
+        self._gray_buf: Optional[NDArray[np.float32]] = None
+        self._u8_buf: Optional[NDArray[np.uint8]] = None
+        self._lut: list[int] = []
+        self._init_throttle()
+        self.set_colormap("viridis")
+
+    def set_colormap(self, cmap: str) -> None:
+        """Rebuild the 256-entry color table (no redraw needed)."""
+        rgba = matplotlib.colormaps[cmap](np.linspace(0, 1, 256))
+        colors = (rgba[:, :3] * 255).astype(np.uint8)
+        self._lut = [qRgb(int(r), int(g), int(b)) for r, g, b in colors]
+        self._last_frame = None  # Next frame repaints with the new LUT
+
+    def _do_redraw(self, frame: NDArray[np.uint8]) -> None:
+        """Render a frame.
+
+        Args:
+            frame: Grayscale or RGB image array.
+        """
+        if frame.ndim == 2 and frame.dtype == np.uint8:
+            gray = frame if frame.flags["C_CONTIGUOUS"] else \
+                np.ascontiguousarray(frame)
+        elif (
+            _HAVE_CV2
+            and frame.ndim == 3
+            and frame.dtype == np.uint8
+            and frame.flags["C_CONTIGUOUS"]
+        ):
+            if self._u8_buf is None or self._u8_buf.shape != frame.shape[:2]:
+                self._u8_buf = np.empty(frame.shape[:2], dtype=np.uint8)
+            gray = _cvt_gray_u8(frame, self._u8_buf)
+        else:
+            g = self._gray_buf = _to_gray_normalized(frame, self._gray_buf)
+            # Quantize the normalized float into the reused u8 buffer
+            if self._u8_buf is None or self._u8_buf.shape != g.shape:
+                self._u8_buf = np.empty(g.shape, dtype=np.uint8)
+            np.multiply(g, np.float32(255.0), out=g)
+            np.copyto(self._u8_buf, g, casting="unsafe")
+            gray = self._u8_buf
+
+        h, w = gray.shape
+        image = QImage(gray.data, w, h, w, QImage.Format.Format_Indexed8)
+        image.setColorTable(self._lut)
+        # fromImage copies during conversion, so the numpy buffer can
+        # be reused for the next frame
+        self._image_label.setPixmap(QPixmap.fromImage(image))
+
+    def clear(self) -> None:
+        """Clear the display."""
+        self._cancel_pending()
+        self._image_label.clear()
+
+
+class IntensityContour(QWidget, _RedrawThrottle):
     """Contour visualization of image intensity.
 
     Displays intensity as contour lines.
@@ -153,67 +798,60 @@ class IntensityContour(QWidget):
         self._cmap = "viridis"
         self._levels = 10
         self._contour = None
+        self._gray_buf: Optional[NDArray[np.float32]] = None
+        self._init_throttle()
 
         # 暗色主题样式（不设置标题，因为已经用 QLabel 了）
+        self._apply_style()
+        # 统一布局参数
+        self._figure.subplots_adjust(left=0.12, right=0.88, top=0.95, bottom=0.1)
+
+    def _apply_style(self) -> None:
+        """Apply axes styling (reapplied after ax.clear() in clear())."""
+        self._ax.set_facecolor('#252729')
+        self._ax.set_aspect("equal")
         self._ax.tick_params(colors='#9B9A97', which='both')
         for spine in self._ax.spines.values():
             spine.set_color('#4F5458')
-        # 统一布局参数
-        self._figure.subplots_adjust(left=0.12, right=0.88, top=0.95, bottom=0.1)
 
     def set_colormap(self, cmap: str) -> None:
         """Set the colormap."""
         self._cmap = cmap
+        self._last_frame = None  # Force a redraw even for a same frame
 
     def set_levels(self, levels: int) -> None:
         """Set number of contour levels."""
         self._levels = levels
+        self._last_frame = None
 
-    def update_frame(self, frame: NDArray[np.uint8]) -> None:
-        """Update with new frame data."""
-        # Convert to grayscale if needed
-        if frame.ndim == 3:
-            gray = (
-                0.299 * frame[:, :, 0] +
-                0.587 * frame[:, :, 1] +
-                0.114 * frame[:, :, 2]
-            ).astype(np.float32)
-        else:
-            gray = frame.astype(np.float32)
+    def _do_redraw(self, frame: NDArray[np.uint8]) -> None:
+        """Render a frame."""
+        # Downsample the raw frame first so the grayscale conversion
+        # runs on the ~200x200 tile instead of the full resolution
+        frame = _downsample(frame, 200)
 
-        # Normalize
-        max_val = np.max(gray)
-        if max_val > 0:
-            gray = gray / max_val
-
-        # Downsample for performance if large
-        h, w = gray.shape
-        max_size = 200
-        if h > max_size or w > max_size:
-            scale = max_size / max(h, w)
-            new_h, new_w = int(h * scale), int(w * scale)
-            # Simple downsampling
-            gray = gray[::h // new_h, ::w // new_w]
+        gray = self._gray_buf = _to_gray_normalized(frame, self._gray_buf)
 
-        self._ax.clear()
-        self._ax.set_facecolor('#252729')  # 重新设置背景色
+        # Remove only the previous contour artist: ax.clear() would
+        # also destroy spines/ticks/facecolor and force the styling
+        # to be rebuilt every frame
+        if self._contour is not None:
+            self._contour.remove()
         self._contour = self._ax.contourf(
             gray, levels=self._levels, cmap=self._cmap
         )
-        self._ax.set_aspect("equal")
-        self._ax.tick_params(colors='#9B9A97', which='both')
-        for spine in self._ax.spines.values():
-            spine.set_color('#4F5458')
         self._canvas.draw_idle()
 
     def clear(self) -> None:
         """Clear the display."""
+        self._cancel_pending()
         self._ax.clear()
+        self._apply_style()
         self._contour = None
         self._canvas.draw_idle()
 
 
-class IntensitySurface(QWidget):
+class IntensitySurface(QWidget, _RedrawThrottle):
     """3D surface visualization of image intensity.
 
     Displays intensity as a 3D surface where height represents intensity.
@@ -247,6 +885,46 @@ class IntensitySurface(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
+        self._cmap = "viridis"
+        self._surface = None
+        self._gray_buf: Optional[NDArray[np.float32]] = None
+        # Meshgrids keyed on downsampled shape: the shape is nearly
+        # constant (capped at max_size), so the 2x O(N^2) grid build
+        # runs once instead of every frame
+        self._grid_cache: dict[
+            tuple[int, int], tuple[NDArray[np.floating], NDArray[np.floating]]
+        ] = {}
+        self._init_throttle()
+
+        # Prefer the GPU-backed pyqtgraph surface when installed:
+        # only the Z buffer is re-uploaded per frame and the mesh is
+        # rasterized in GL shaders, versus matplotlib rebuilding the
+        # whole Poly3DCollection in Agg
+        self._use_gl = _HAVE_GL
+        if self._use_gl:
+            self._init_gl(layout)
+        else:
+            self._init_mpl(layout)
+
+    def _init_gl(self, layout: QVBoxLayout) -> None:
+        """Set up the pyqtgraph OpenGL surface backend."""
+        self._gl_shape: Optional[tuple[int, int]] = None
+        self._gl_lut = self._build_gl_lut(self._cmap)
+        self._gl_widget = gl.GLViewWidget()
+        self._gl_widget.setBackgroundColor(self._COLOR_FIGURE_BG)
+        self._gl_widget.setCameraPosition(distance=2.2, elevation=30,
+                                          azimuth=-60)
+        flat = np.zeros((2, 2), dtype=np.float32)
+        self._surface_item = gl.GLSurfacePlotItem(
+            z=flat, colors=self._gl_colors(flat),
+            computeNormals=False, smooth=False)
+        # Center the unit square on the camera target
+        self._surface_item.translate(-0.5, -0.5, 0)
+        self._gl_widget.addItem(self._surface_item)
+        layout.addWidget(self._gl_widget)
+
+    def _init_mpl(self, layout: QVBoxLayout) -> None:
+        """Set up the matplotlib 3D fallback backend."""
         self._figure = Figure(figsize=(4, 4), dpi=100,
                               facecolor=self._COLOR_FIGURE_BG)
         self._canvas = FigureCanvas(self._figure)
@@ -257,9 +935,6 @@ class IntensitySurface(QWidget):
         self._ax.disable_mouse_rotation()
         layout.addWidget(self._canvas)
 
-        self._cmap = "viridis"
-        self._surface = None
-
         # --- Persistent settings (survive ax.clear()) ---
 
         self._ax.set_box_aspect(self._BOX_ASPECT, zoom=self._BOX_ZOOM)
@@ -281,6 +956,14 @@ class IntensitySurface(QWidget):
 
         # --- Non-persistent settings (reset by ax.clear()) ---
         self._apply_post_clear_style()
+        self._apply_mpl_limits()
+
+    def _apply_mpl_limits(self) -> None:
+        """Fix the unit-cube limits (reapplied after clear())."""
+        self._ax.set_xlim(0, 1)
+        self._ax.set_ylim(0, 1)
+        self._ax.set_zlim(0, 1)
+        self._ax.margins(x=0.0, y=0.0, z=0.0)
 
     def _apply_post_clear_style(self) -> None:
         """Apply axes styling that is reset by ax.clear()."""
@@ -313,58 +996,86 @@ class IntensitySurface(QWidget):
     def set_colormap(self, cmap: str) -> None:
         """Set the colormap."""
         self._cmap = cmap
+        if self._use_gl:
+            self._gl_lut = self._build_gl_lut(cmap)
+        self._last_frame = None  # Force a redraw even for a same frame
 
-    def update_frame(self, frame: NDArray[np.uint8]) -> None:
-        """Update with new frame data."""
-        if frame.ndim == 3:
-            gray = (
-                0.299 * frame[:, :, 0] +
-                0.587 * frame[:, :, 1] +
-                0.114 * frame[:, :, 2]
-            ).astype(np.float32)
-        else:
-            gray = frame.astype(np.float32)
+    @staticmethod
+    def _build_gl_lut(cmap: str) -> NDArray[np.float32]:
+        """256-entry RGBA table sampled from a matplotlib colormap.
 
-        max_val = np.max(gray)
-        if max_val > 0:
-            gray = gray / max_val
-
-        # Downsample for performance (3D is expensive)
-        h, w = gray.shape
-        max_size = 100
-        if h > max_size or w > max_size:
-            scale = max_size / max(h, w)
-            new_h, new_w = int(h * scale), int(w * scale)
-            step_h = max(1, h // new_h)
-            step_w = max(1, w // new_w)
-            gray = gray[::step_h, ::step_w]
+        GLSurfacePlotItem has no colormap support of its own, so the
+        GL backend colors vertices by looking heights up in this
+        table — keeping set_colormap effective in both backends.
+        """
+        return matplotlib.colormaps[cmap](
+            np.linspace(0.0, 1.0, 256)
+        ).astype(np.float32)
+
+    def _gl_colors(self, gray: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Per-vertex RGBA colors for a normalized height field."""
+        indices = (gray * np.float32(255.0)).astype(np.uint8)
+        return self._gl_lut[indices.reshape(-1)]
+
+    def _do_redraw(self, frame: NDArray[np.uint8]) -> None:
+        """Render a frame."""
+        # Downsample the raw frame first (3D is expensive, and the
+        # grayscale pass then only touches the ~100x100 tile)
+        frame = _downsample(frame, 100)
+
+        gray = self._gray_buf = _to_gray_normalized(frame, self._gray_buf)
+
+        if self._use_gl:
+            # Upload the Z buffer and its LUT colors; x/y vertices
+            # are reused until the tile shape changes
+            colors = self._gl_colors(gray)
+            if gray.shape != self._gl_shape:
+                self._gl_shape = gray.shape
+                self._surface_item.setData(
+                    x=np.linspace(0, 1, gray.shape[0]),
+                    y=np.linspace(0, 1, gray.shape[1]),
+                    z=gray, colors=colors,
+                )
+            else:
+                self._surface_item.setData(z=gray, colors=colors)
+            return
 
         h, w = gray.shape
-        x = np.linspace(0, 1, w)
-        y = np.linspace(0, 1, h)
-        X, Y = np.meshgrid(x, y)
-
-        elev = self._ax.elev
-        azim = self._ax.azim
-
-        self._ax.clear()
-        self._ax.set_facecolor(self._COLOR_AXES_BG)
+        grid = self._grid_cache.get((h, w))
+        if grid is None:
+            # float32 halves the vertex bytes; the surface is purely
+            # visual so the precision loss is irrelevant
+            x = np.linspace(0, 1, w, dtype=np.float32)
+            y = np.linspace(0, 1, h, dtype=np.float32)
+            grid = np.meshgrid(x, y)
+            self._grid_cache[(h, w)] = grid
+        X, Y = grid
+
+        # Remove only the previous surface collection: ax.clear()
+        # would also destroy limits, locators, labels and the view
+        # angle, all of which now persist between frames
+        if self._surface is not None:
+            self._surface.remove()
         self._surface = self._ax.plot_surface(
             X, Y, gray, cmap=self._cmap, linewidth=0, antialiased=False
         )
 
-        self._ax.set_xlim(0, 1)
-        self._ax.set_ylim(0, 1)
-        self._ax.set_zlim(0, 1)
-        self._ax.margins(x=0.0, y=0.0, z=0.0)
-
-        self._ax.view_init(elev=elev, azim=azim)
-        self._apply_post_clear_style()
-
         self._canvas.draw_idle()
 
     def clear(self) -> None:
         """Clear the display."""
+        self._cancel_pending()
+        if self._use_gl:
+            self._gl_shape = None
+            flat = np.zeros((2, 2), dtype=np.float32)
+            self._surface_item.setData(
+                x=np.array([0.0, 1.0]), y=np.array([0.0, 1.0]),
+                z=flat, colors=self._gl_colors(flat),
+            )
+            return
         self._ax.clear()
+        self._ax.set_facecolor(self._COLOR_AXES_BG)
+        self._apply_post_clear_style()
+        self._apply_mpl_limits()
         self._surface = None
         self._canvas.draw_idle()
@@ -0,0 +1,31 @@
+"""Shared fixtures for the test suite."""
+
+import cv2
+import numpy as np
+import pytest
+
+
+# Test image pixel data, allocated once for the whole session and
+# read-only so no test can mutate it for the others
+_FRAME_ARRAYS = {
+    i: np.full((100, 100), i * 50, dtype=np.uint8) for i in range(5)
+}
+for _array in _FRAME_ARRAYS.values():
+    _array.setflags(write=False)
+
+
+@pytest.fixture(scope="session")
+def temp_image_folder(tmp_path_factory):
+    """Session-scoped folder with five test images.
+
+    Every consumer only reads from the folder, so one round of PNG
+    encodes serves the whole session instead of one per test.
+    """
+    folder = tmp_path_factory.mktemp("image_sequence")
+
+    # Create 5 test images with different intensities (cv2 writes a
+    # 2-D uint8 array as a grayscale PNG, same as PIL mode "L")
+    for i, img_array in _FRAME_ARRAYS.items():
+        cv2.imwrite(str(folder / f"frame_{i:03d}.png"), img_array)
+
+    return folder
@@ -212,6 +212,34 @@ class TestIntensityTracker:
         assert len(history) == 1
         assert history[0] == (0, 150.0)  # Updated value
 
+    def test_add_many_matches_repeated_add(self) -> None:
+        """add_many records the same history as per-sample add calls."""
+        tracker = IntensityTracker()
+        tracker.add_many("roi1", np.arange(5), np.arange(5, dtype=float) * 2)
+
+        assert tracker.frame_count("roi1") == 5
+        assert tracker.get_history("roi1") == [(i, 2.0 * i) for i in range(5)]
+        assert tracker.get_latest("roi1") == 8.0
+
+    def test_add_many_updates_duplicates(self) -> None:
+        """add_many updates existing frame indices in place."""
+        tracker = IntensityTracker()
+        tracker.add("roi1", 0, 100.0)
+        tracker.add_many("roi1", np.array([0, 1]), np.array([150.0, 110.0]))
+
+        assert tracker.get_history("roi1") == [(0, 150.0), (1, 110.0)]
+
+    def test_add_many_respects_max_history(self) -> None:
+        """add_many evicts oldest samples past max_history."""
+        tracker = IntensityTracker(max_history=3)
+        tracker.add_many(
+            "roi1", np.arange(10), np.arange(10, dtype=float)
+        )
+
+        history = tracker.get_history("roi1")
+        assert len(history) == 3
+        assert history == [(7, 7.0), (8, 8.0), (9, 9.0)]
+
     def test_frame_count(self) -> None:
         """frame_count returns number of recorded frames."""
         tracker = IntensityTracker()
@@ -143,3 +143,79 @@ class TestROIManager:
         roi3 = manager.add(x=200, y=200, width=30, height=30)
         colors = {roi1.color, roi2.color, roi3.color}
         assert len(colors) == 3  # All different
+
+    def test_palette_distinct_for_64_rois(self) -> None:
+        """The first 64 auto-assigned colors are all distinct."""
+        manager = ROIManager()
+        colors = {
+            manager.add(x=i, y=0, width=5, height=5).color
+            for i in range(64)
+        }
+        assert len(colors) == 64
+
+    def test_hit_test(self) -> None:
+        """hit_test returns the id of the ROI containing the point."""
+        manager = ROIManager()
+        rois = [
+            manager.add(x=i * 10, y=0, width=10, height=10)
+            for i in range(10_000)
+        ]
+
+        assert manager.hit_test(5, 5) == rois[0].id
+        assert manager.hit_test(99_995, 3) == rois[9_999].id
+        assert manager.hit_test(5, 50) is None
+
+    def test_hit_test_prefers_most_recent(self) -> None:
+        """Overlapping ROIs: the most recently added one wins."""
+        manager = ROIManager()
+        roi1 = manager.add(x=0, y=0, width=20, height=20)
+        roi2 = manager.add(x=5, y=5, width=20, height=20)
+
+        assert manager.hit_test(10, 10) == roi2.id
+        assert manager.hit_test(2, 2) == roi1.id
+
+    def test_hit_test_tracks_remove_and_update(self) -> None:
+        """hit_test reflects removals and geometry updates."""
+        manager = ROIManager()
+        roi1 = manager.add(x=0, y=0, width=10, height=10)
+        roi2 = manager.add(x=100, y=100, width=10, height=10)
+
+        manager.remove(roi1.id)
+        assert manager.hit_test(5, 5) is None
+
+        manager.update(roi2.id, x=0, y=0)
+        assert manager.hit_test(5, 5) == roi2.id
+
+    def test_hit_test_after_in_place_mutation(self) -> None:
+        """sync_geometry refreshes bounds for ROIs mutated directly.
+
+        Graphics items write drag geometry straight into the ROI
+        object; hit_test must answer from the new position once
+        sync_geometry is called.
+        """
+        manager = ROIManager()
+        roi = manager.add(x=0, y=0, width=10, height=10)
+
+        # Simulate ROIGraphicsItem.sync_to_roi after a drag
+        roi.x = 100
+        roi.y = 100
+        manager.sync_geometry(roi.id)
+
+        assert manager.hit_test(5, 5) is None
+        assert manager.hit_test(105, 105) == roi.id
+
+        assert manager.sync_geometry("missing") is False
+
+    def test_remove_preserves_recency_order(self) -> None:
+        """Removal keeps most-recently-added-wins for overlapping hits."""
+        manager = ROIManager()
+        roi1 = manager.add(x=0, y=0, width=20, height=20)
+        roi2 = manager.add(x=0, y=0, width=20, height=20)
+        roi3 = manager.add(x=0, y=0, width=20, height=20)
+
+        # Removing the oldest must not promote it past the newer ones
+        manager.remove(roi1.id)
+        assert manager.hit_test(10, 10) == roi3.id
+
+        manager.remove(roi3.id)
+        assert manager.hit_test(10, 10) == roi2.id
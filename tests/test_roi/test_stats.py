@@ -0,0 +1,41 @@
+"""Tests for bulk ROI statistics."""
+
+import numpy as np
+
+from pyrheed.roi.stats import compute_means
+
+
+class TestComputeMeans:
+    """Tests for compute_means."""
+
+    def test_matches_per_roi_numpy_means(self) -> None:
+        """Bulk kernel agrees with per-ROI numpy slice means."""
+        rng = np.random.default_rng(42)
+        frame = rng.integers(0, 256, size=(200, 300), dtype=np.uint8)
+
+        bounds = np.array(
+            [
+                [0, 0, 50, 40],
+                [250, 150, 50, 50],
+                [10, 190, 20, 10],
+                [100, 100, 1, 1],
+            ],
+            dtype=np.int64,
+        )
+
+        means = compute_means(frame, bounds)
+
+        expected = [
+            frame[y:y + h, x:x + w].mean(dtype=np.float64)
+            for x, y, w, h in bounds
+        ]
+        np.testing.assert_allclose(means, expected, rtol=1e-9)
+
+    def test_empty_bounds(self) -> None:
+        """No ROIs yields an empty result."""
+        frame = np.zeros((10, 10), dtype=np.uint8)
+        bounds = np.empty((0, 4), dtype=np.int64)
+
+        means = compute_means(frame, bounds)
+
+        assert means.shape == (0,)
@@ -9,6 +9,12 @@ from pyrheed.video.camera import CameraSource, enumerate_cameras
 from pyrheed.video.source import SourceState
 
 
+# Shared across all tests instead of reallocating 900 KB per fixture
+# use; read-only so no test can mutate it for the others
+_TEST_FRAME = np.full((480, 640, 3), 128, dtype=np.uint8)
+_TEST_FRAME.setflags(write=False)
+
+
 @pytest.fixture
 def mock_camera():
     """Create a mock camera that returns test frames."""
@@ -28,9 +34,10 @@ def mock_camera():
         }.get(prop, 0.0)
         mock_cap.getBackendName.return_value = "MOCK"
 
-        # Return test frame
-        test_frame = np.full((480, 640, 3), 128, dtype=np.uint8)
-        mock_cap.read.return_value = (True, test_frame)
+        # Return the shared test frame
+        mock_cap.read.return_value = (True, _TEST_FRAME)
+        mock_cap.grab.return_value = True
+        mock_cap.retrieve.return_value = (True, _TEST_FRAME)
 
         mock_cap_class.return_value = mock_cap
 
@@ -42,12 +49,125 @@ class TestCameraSource:
 
     def test_open_valid_device(self, mock_camera):
         """open() should succeed with valid device ID."""
+        import cv2
+
         source = CameraSource()
         result = source.open("0")
 
         assert result is True
         assert source.fps == 30.0
 
+        # Stream format is pinned before the first read
+        mock_camera.set.assert_any_call(
+            cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG")
+        )
+        mock_camera.set.assert_any_call(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        mock_camera.set.assert_any_call(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+
+        source.close()
+
+    def test_hardware_grayscale_requested(self, mock_camera):
+        """open() should ask for Y-only frames when grayscale is on."""
+        import cv2
+
+        source = CameraSource()
+        source.open("0")  # Grayscale is the default for RHEED
+
+        mock_camera.set.assert_any_call(cv2.CAP_PROP_CONVERT_RGB, 0)
+        mock_camera.set.assert_any_call(
+            cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"GREY")
+        )
+
+        source.close()
+
+    def test_hardware_grayscale_verified_by_readback(self, mock_camera):
+        """Y-only mode is rejected when frames stay color.
+
+        Regression test: set() return values alone were trusted, but
+        V4L2 reports success for formats it does not honor. The mock
+        accepts every set() yet keeps delivering 3-D BGR frames, so
+        the read-back check must restore BGR/MJPG delivery.
+        """
+        import cv2
+
+        source = CameraSource()
+        source.open("0")  # Grayscale is the default for RHEED
+
+        mock_camera.set.assert_any_call(cv2.CAP_PROP_CONVERT_RGB, 1)
+        mock_camera.set.assert_any_call(
+            cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG")
+        )
+
+        source.close()
+
+    def test_get_frame_passes_through_y_only_frames(self, mock_camera):
+        """2-D hardware-grayscale frames skip cvtColor in get_frame.
+
+        Regression test: routing Y-only frames through _convert_bgr
+        raised cv2.error on every synchronous read exactly when
+        hardware grayscale worked.
+        """
+        gray_frame = np.zeros((480, 640), dtype=np.uint8)
+        mock_camera.read.return_value = (True, gray_frame)
+
+        source = CameraSource()
+        source.open("0")
+
+        frame = source.get_frame(0)
+        assert frame is gray_frame
+
+        source.close()
+
+    def test_color_mode_reverts_hardware_grayscale(self, mock_camera):
+        """Switching to color restores the BGR/MJPG stream format."""
+        import cv2
+
+        # Read-back verification sees a 2-D frame of the negotiated
+        # height, so hardware grayscale is accepted at open()
+        gray_frame = np.zeros((480, 640), dtype=np.uint8)
+        mock_camera.read.return_value = (True, gray_frame)
+
+        source = CameraSource()
+        source.open("0")
+        assert source._hw_grayscale is True
+
+        mock_camera.set.reset_mock()
+        source.grayscale = False
+
+        mock_camera.set.assert_any_call(cv2.CAP_PROP_CONVERT_RGB, 1)
+        mock_camera.set.assert_any_call(
+            cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG")
+        )
+        assert source._hw_grayscale is False
+
+        source.close()
+
+    def test_conversion_failure_keeps_worker_alive(self, mock_camera, qtbot):
+        """A conversion error emits ERROR_OCCURRED, not a dead thread."""
+        source = CameraSource()
+        source.open("0")
+
+        with patch(
+            "pyrheed.video.camera.cv2.cvtColor",
+            side_effect=ValueError("bad frame layout"),
+        ):
+            with qtbot.waitSignal(source.ERROR_OCCURRED, timeout=1000) as blocker:
+                source.start()
+
+            assert "conversion failed" in blocker.args[0].lower()
+            assert source._worker.isRunning()
+
+        source.stop()
+
+    def test_buffer_size_set_to_one(self, mock_camera):
+        """open() should request a single-frame driver buffer."""
+        import cv2
+
+        source = CameraSource()
+        source.open("0")
+
+        mock_camera.set.assert_any_call(cv2.CAP_PROP_BUFFERSIZE, 1)
+
         source.close()
 
     def test_open_invalid_device_id(self):
@@ -201,6 +321,46 @@ class TestCameraSource:
 
         assert "No camera opened" in blocker.args[0]
 
+    def test_selective_decode(self, mock_camera, qtbot):
+        """Worker grabs every frame but only decodes at the target FPS."""
+        source = CameraSource()
+        source.open("0")
+        source.set_fps(5)  # Well below the camera rate
+
+        with qtbot.waitSignal(source.FRAME_READY, timeout=1000):
+            source.start()
+        qtbot.wait(100)  # Let the loop grab without decoding
+        source.stop()
+
+        assert mock_camera.grab.call_count > mock_camera.retrieve.call_count
+
+        source.close()
+
+    def test_emitted_frame_is_readonly(self, mock_camera, qtbot):
+        """FRAME_READY frames are read-only views of the ring slots."""
+        source = CameraSource()
+        source.open("0")
+
+        with qtbot.waitSignal(source.FRAME_READY, timeout=1000) as blocker:
+            source.start()
+        source.stop()
+
+        assert blocker.args[0].flags.writeable is False
+
+        source.close()
+
+    def test_set_fps_clamps_range(self, mock_camera):
+        """set_fps() should clamp the emit rate to a sane range."""
+        source = CameraSource()
+        source.open("0")
+
+        source.set_fps(0)
+        assert source._target_fps == 1.0
+        source.set_fps(500)
+        assert source._target_fps == 120.0
+
+        source.close()
+
     def test_pause_stops_camera(self, mock_camera):
         """pause() should stop the camera (no pause for live)."""
         source = CameraSource()
@@ -228,7 +388,7 @@ class TestEnumerateCameras:
             mock_cap.isOpened.return_value = False
             mock_cap_class.return_value = mock_cap
 
-            devices = enumerate_cameras(max_devices=3)
+            devices = enumerate_cameras(max_devices=3, force=True)
 
             assert devices == []
 
@@ -244,10 +404,28 @@ class TestEnumerateCameras:
 
             mock_cap_class.side_effect = create_mock
 
-            devices = enumerate_cameras(max_devices=5)
+            devices = enumerate_cameras(max_devices=5, force=True)
 
             assert len(devices) == 2
             assert devices[0]["id"] == 0
             assert devices[0]["available"] is True
             assert "V4L2" in devices[0]["name"]
             assert devices[1]["id"] == 1
+
+    def test_enumeration_cached(self):
+        """Repeated calls reuse the cached probe result."""
+        with patch("pyrheed.video.camera.cv2.VideoCapture") as mock_cap_class:
+            mock_cap = MagicMock()
+            mock_cap.isOpened.return_value = False
+            mock_cap_class.return_value = mock_cap
+
+            enumerate_cameras(max_devices=2, force=True)
+            probes = mock_cap_class.call_count
+
+            # Cache hit: no new device opens
+            enumerate_cameras(max_devices=2)
+            assert mock_cap_class.call_count == probes
+
+            # force=True re-probes
+            enumerate_cameras(max_devices=2, force=True)
+            assert mock_cap_class.call_count > probes
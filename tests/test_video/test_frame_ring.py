@@ -0,0 +1,153 @@
+"""Tests for FrameRing."""
+
+import numpy as np
+
+from pyrheed.video.frame_ring import FrameRing
+
+
+class TestFrameRing:
+    """Tests for the SPSC frame ring buffer."""
+
+    def test_acquire_before_configure(self):
+        """acquire() should return None before slots are allocated."""
+        ring = FrameRing()
+
+        assert ring.acquire() is None
+
+    def test_configure_allocates_slots(self):
+        """configure() should allocate slots of the requested shape."""
+        ring = FrameRing(slot_count=4)
+        ring.configure((480, 640))
+
+        assert ring.shape == (480, 640)
+
+        result = ring.acquire()
+        assert result is not None
+        slot_idx, buf = result
+        assert buf.shape == (480, 640)
+        assert buf.dtype == np.uint8
+
+    def test_produce_consume_roundtrip(self):
+        """A committed slot should be readable in place via view()."""
+        ring = FrameRing(slot_count=4)
+        ring.configure((10, 10))
+
+        slot_idx, buf = ring.acquire()
+        buf[:] = 42
+        committed_idx = ring.commit()
+
+        assert committed_idx == slot_idx
+        assert ring.view(committed_idx) is buf
+        assert np.all(ring.view(committed_idx) == 42)
+
+        ring.release(committed_idx)
+
+    def test_full_ring_returns_none(self):
+        """acquire() should return None when all slots are unreleased."""
+        ring = FrameRing(slot_count=2)
+        ring.configure((4, 4))
+
+        for _ in range(2):
+            assert ring.acquire() is not None
+            ring.commit()
+
+        assert ring.acquire() is None
+
+    def test_release_frees_slot(self):
+        """release() should make a slot writable again."""
+        ring = FrameRing(slot_count=2)
+        ring.configure((4, 4))
+
+        first_idx, _ = ring.acquire()
+        ring.commit()
+        ring.acquire()
+        ring.commit()
+
+        ring.release(first_idx)
+
+        result = ring.acquire()
+        assert result is not None
+        assert result[0] == first_idx  # Oldest slot is reused
+
+    def test_drop_oldest_frees_slot(self):
+        """drop_oldest() should discard the oldest published frame."""
+        ring = FrameRing(slot_count=2)
+        ring.configure((4, 4))
+
+        ring.acquire()
+        ring.commit()
+        ring.acquire()
+        ring.commit()
+        assert ring.acquire() is None
+
+        ring.drop_oldest()
+
+        assert ring.acquire() is not None
+
+    def test_reconfigure_same_shape_is_noop(self):
+        """configure() with the same shape should keep existing slots."""
+        ring = FrameRing(slot_count=2)
+        ring.configure((4, 4))
+
+        slot_idx, buf = ring.acquire()
+        ring.commit()
+        ring.configure((4, 4))
+
+        assert ring.view(slot_idx) is buf
+
+    def test_reconfigure_new_shape_reallocates(self):
+        """configure() with a new shape should reset the ring."""
+        ring = FrameRing(slot_count=2)
+        ring.configure((4, 4))
+        ring.acquire()
+        ring.commit()
+
+        ring.configure((8, 8, 3))
+
+        assert ring.shape == (8, 8, 3)
+        result = ring.acquire()
+        assert result is not None
+        assert result[1].shape == (8, 8, 3)
+
+    def test_concurrent_release_and_drop(self):
+        """Producer drops and consumer releases may race on the tail.
+
+        Regression test for the unsynchronized two-writer tail: a
+        lost increment left the ring permanently "full". Hammer both
+        paths from two threads, then verify the accounting drained
+        back to a ring that can hold a full complement of frames.
+        """
+        import threading
+
+        ring = FrameRing(slot_count=4)
+        ring.configure((2, 2))
+
+        stop = threading.Event()
+
+        def consume() -> None:
+            while not stop.is_set():
+                ring.release(0)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        try:
+            for _ in range(20_000):
+                if ring.acquire() is None:
+                    ring.drop_oldest()
+                    assert ring.acquire() is not None
+                ring.commit()
+        finally:
+            stop.set()
+            consumer.join()
+
+        # Drain: release() past empty is a no-op, so slot_count calls
+        # suffice regardless of what is still published
+        for _ in range(ring.slot_count):
+            ring.release(0)
+
+        # The full capacity must be writable again; a leaked slot
+        # would stop acquire() one short
+        for _ in range(ring.slot_count):
+            assert ring.acquire() is not None
+            ring.commit()
+        assert ring.acquire() is None
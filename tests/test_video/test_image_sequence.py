@@ -3,27 +3,15 @@
 import tempfile
 from pathlib import Path
 
+import cv2
 import numpy as np
 import pytest
-from PIL import Image
 
 from pyrheed.video.image_sequence import ImageSequenceSource, SUPPORTED_EXTENSIONS
 from pyrheed.video.source import SourceState
 
 
-@pytest.fixture
-def temp_image_folder():
-    """Create a temporary folder with test images."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        folder = Path(tmpdir)
-
-        # Create 5 test images with different intensities
-        for i in range(5):
-            img_array = np.full((100, 100), i * 50, dtype=np.uint8)
-            img = Image.fromarray(img_array, mode="L")
-            img.save(folder / f"frame_{i:03d}.png")
-
-        yield folder
+# temp_image_folder is session-scoped and shared via tests/conftest.py
 
 
 @pytest.fixture
@@ -69,12 +57,25 @@ class TestImageSequenceSource:
         assert frame0 is not None
         assert frame0.shape == (100, 100)
         assert frame0.dtype == np.uint8
-        assert np.all(frame0 == 0)
+        assert frame0.min() == frame0.max() == 0
 
         # Third frame should be 100
         frame2 = source.get_frame(2)
         assert frame2 is not None
-        assert np.all(frame2 == 100)
+        assert frame2.min() == frame2.max() == 100
+
+    def test_get_frames_batch(self, temp_image_folder):
+        """get_frames() should decode multiple frames in parallel."""
+        source = ImageSequenceSource()
+        source.open(str(temp_image_folder))
+
+        frames = source.get_frames([0, 2, 4, 100])
+
+        assert len(frames) == 4
+        assert frames[0].min() == frames[0].max() == 0
+        assert frames[1].min() == frames[1].max() == 100
+        assert frames[2].min() == frames[2].max() == 200
+        assert frames[3] is None  # Out of bounds
 
     def test_get_frame_out_of_bounds(self, temp_image_folder):
         """get_frame() should return None for invalid index."""
@@ -98,7 +99,30 @@ class TestImageSequenceSource:
         # Check signal args: (frame_data, frame_index)
         frame_data, frame_index = blocker.args
         assert frame_index == 3
-        assert np.all(frame_data == 150)  # 3 * 50
+        assert frame_data.min() == frame_data.max() == 150  # 3 * 50
+
+    def test_emitted_frame_is_readonly(self, temp_image_folder, qtbot):
+        """FRAME_READY frames are read-only views (no defensive copy)."""
+        source = ImageSequenceSource()
+        source.open(str(temp_image_folder))
+
+        with qtbot.waitSignal(source.FRAME_READY, timeout=1000) as blocker:
+            source.seek(1)
+
+        assert blocker.args[0].flags.writeable is False
+
+    def test_seek_by_name(self, temp_image_folder, qtbot):
+        """seek_by_name() should find the frame for a filename."""
+        source = ImageSequenceSource()
+        source.open(str(temp_image_folder))
+
+        with qtbot.waitSignal(source.FRAME_READY, timeout=1000):
+            result = source.seek_by_name("frame_002.png")
+
+        assert result is True
+        assert source.current_frame_index == 2
+
+        assert source.seek_by_name("no_such_frame.png") is False
 
     def test_seek_invalid_index(self, temp_image_folder):
         """seek() should fail for invalid index."""
@@ -200,6 +224,64 @@ class TestImageSequenceSource:
         # Should be the same object (cached)
         assert frame1 is frame2
 
+    def test_held_frames_survive_cache_eviction(self, tmp_path):
+        """Frames handed out earlier keep their data after eviction.
+
+        Regression test: cached frames once shared recycled block
+        storage, so pushing more frames than the cache holds
+        overwrote arrays callers were still holding.
+        """
+        count = 20  # More frames than the cache capacity (16)
+        for i in range(count):
+            cv2.imwrite(
+                str(tmp_path / f"frame_{i:03d}.png"),
+                np.full((16, 16), i * 10, dtype=np.uint8),
+            )
+
+        source = ImageSequenceSource()
+        source.open(str(tmp_path))
+
+        frames = [source.get_frame(i) for i in range(count)]
+
+        for i, frame in enumerate(frames):
+            assert frame.min() == frame.max() == i * 10
+
+        source.close()
+
+    def test_frames_packed_into_cube(self, temp_image_folder):
+        """Folder frames are background-decoded into one memmap cube."""
+        source = ImageSequenceSource()
+        source.open(str(temp_image_folder))
+
+        source._cube_thread.join(timeout=5.0)
+
+        assert source._cube is not None
+        assert source._cube.shape == (5, 100, 100)
+        assert bool(source._cube_filled.all())
+        assert source._cube[2].min() == source._cube[2].max() == 100
+
+        # Frames served from the cube match the per-frame decode
+        frame = source.get_frame(3)
+        assert frame.min() == frame.max() == 150
+
+        source.close()
+        assert source._cube is None
+
+    def test_cube_build_respects_size_cap(self, temp_image_folder):
+        """Sequences over the disk budget skip the cube build."""
+        source = ImageSequenceSource()
+        source.cube_max_bytes = 1  # Even five small frames are over budget
+        source.open(str(temp_image_folder))
+
+        source._cube_thread.join(timeout=5.0)
+
+        assert source._cube is None
+        # The per-frame decode path still serves frames
+        frame = source.get_frame(3)
+        assert frame.min() == frame.max() == 150
+
+        source.close()
+
     def test_images_sorted_alphabetically(self, temp_image_folder):
         """Images should be sorted by filename."""
         source = ImageSequenceSource()
@@ -210,6 +292,64 @@ class TestImageSequenceSource:
             path = source.get_image_path(i)
             assert path.name == f"frame_{i:03d}.png"
 
+    def test_open_tiff_stack(self, tmp_path):
+        """open() should memory-map a multi-page TIFF stack."""
+        tifffile = pytest.importorskip("tifffile")
+
+        stack_path = tmp_path / "stack.tif"
+        data = np.stack(
+            [np.full((50, 50), i * 40, dtype=np.uint8) for i in range(4)]
+        )
+        tifffile.imwrite(stack_path, data, photometric="minisblack")
+
+        source = ImageSequenceSource()
+        result = source.open(str(stack_path))
+
+        assert result is True
+        assert source.total_frames == 4
+
+        frame = source.get_frame(2)
+        assert frame is not None
+        assert frame.shape == (50, 50)
+        assert frame.min() == frame.max() == 80
+
+        # Frames are zero-copy views into the mapped file
+        assert frame.base is not None
+
+        assert source.get_image_path(1) == stack_path
+
+        source.close()
+
+    def test_tiff_stack_quantizes_with_global_scale(self, tmp_path):
+        """16-bit quantization preserves inter-frame intensity ratios.
+
+        Regression test: scaling each frame by its own max is
+        per-frame auto-gain — a real 2x intensity difference between
+        frames came out as uniform 255 in both, erasing exactly the
+        oscillations RHEED growth monitoring measures.
+        """
+        tifffile = pytest.importorskip("tifffile")
+
+        stack_path = tmp_path / "stack16.tif"
+        data = np.stack([
+            np.full((20, 20), 1000, dtype=np.uint16),
+            np.full((20, 20), 2000, dtype=np.uint16),
+        ])
+        tifffile.imwrite(stack_path, data, photometric="minisblack")
+
+        source = ImageSequenceSource()
+        assert source.open(str(stack_path)) is True
+
+        frame0 = source.get_frame(0)
+        frame1 = source.get_frame(1)
+
+        # The stack peak maps to full range; the dimmer frame keeps
+        # its half-intensity ratio
+        assert frame1.min() == frame1.max() == 255
+        assert abs(int(frame0[0, 0]) * 2 - 255) <= 2
+
+        source.close()
+
     def test_error_signal_on_invalid_folder(self, qtbot):
         """ERROR_OCCURRED should be emitted for invalid folder."""
         source = ImageSequenceSource()
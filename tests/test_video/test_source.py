@@ -109,11 +109,11 @@ class TestFrameSource:
         assert frame is not None
         assert frame.shape == (100, 100)
         assert frame.dtype == np.uint8
-        assert np.all(frame == 0)  # First frame is all zeros
+        assert frame.min() == frame.max() == 0  # First frame is all zeros
 
         frame = source.get_frame(4)
         assert frame is not None
-        assert np.all(frame == 100)  # 4 * 25 = 100
+        assert frame.min() == frame.max() == 100  # 4 * 25 = 100
 
     def test_get_frame_out_of_bounds(self) -> None:
         """get_frame should return None for invalid index."""
@@ -0,0 +1,187 @@
+"""Tests for intensity visualization widgets."""
+
+import matplotlib
+import numpy as np
+import pytest
+
+from pyrheed.visualization.intensity_view import (
+    IntensityHeatmap,
+    IntensityHeatmapQImage,
+)
+
+
+@pytest.fixture
+def qimage_widget(qtbot):
+    """IntensityHeatmapQImage widget (no worker thread to manage)."""
+    widget = IntensityHeatmapQImage()
+    qtbot.addWidget(widget)
+    return widget
+
+
+@pytest.fixture
+def heatmap(qtbot):
+    """IntensityHeatmap widget, conversion thread stopped on teardown."""
+    widget = IntensityHeatmap()
+    qtbot.addWidget(widget)
+    yield widget
+    widget._stop_worker()
+
+
+class TestRedrawThrottle:
+    """Tests for the shared update coalescing/duplicate-skip logic."""
+
+    def test_rapid_updates_coalesce(self, qimage_widget, qtbot, monkeypatch):
+        """Frames pushed faster than the render cap collapse to one redraw."""
+        rendered = []
+        monkeypatch.setattr(
+            qimage_widget, "_do_redraw", lambda frame: rendered.append(frame)
+        )
+
+        frames = [np.full((8, 8), i, dtype=np.uint8) for i in range(5)]
+        for frame in frames:
+            qimage_widget.update_frame(frame)
+
+        qtbot.waitUntil(lambda: len(rendered) == 1, timeout=1000)
+        assert rendered[0] is frames[-1]
+
+        # No further redraws once the burst is flushed
+        qtbot.wait(80)
+        assert len(rendered) == 1
+
+    def test_duplicate_skip_is_exact(self, qimage_widget, qtbot, monkeypatch):
+        """Identical frames are skipped; any pixel change redraws.
+
+        Regression test: a 16-strided sampling digest missed changes
+        confined to off-grid pixels and froze the display.
+        """
+        rendered = []
+        monkeypatch.setattr(
+            qimage_widget, "_do_redraw", lambda frame: rendered.append(frame)
+        )
+
+        frame = np.zeros((64, 64), dtype=np.uint8)
+        qimage_widget.update_frame(frame.copy())
+        qtbot.waitUntil(lambda: len(rendered) == 1, timeout=1000)
+
+        # Same content again: skipped
+        qimage_widget.update_frame(frame.copy())
+        qtbot.wait(80)
+        assert len(rendered) == 1
+
+        # One pixel off the old 16x16 sample grid must redraw
+        changed = frame.copy()
+        changed[3, 5] = 7
+        qimage_widget.update_frame(changed)
+        qtbot.waitUntil(lambda: len(rendered) == 2, timeout=1000)
+
+    def test_clear_and_colormap_reset_duplicate_skip(
+        self, qimage_widget, qtbot, monkeypatch
+    ):
+        """clear() and set_colormap() force the next frame to draw."""
+        rendered = []
+        monkeypatch.setattr(
+            qimage_widget, "_do_redraw", lambda frame: rendered.append(frame)
+        )
+
+        frame = np.full((8, 8), 9, dtype=np.uint8)
+        qimage_widget.update_frame(frame)
+        qtbot.waitUntil(lambda: len(rendered) == 1, timeout=1000)
+
+        qimage_widget.clear()
+        qimage_widget.update_frame(frame)
+        qtbot.waitUntil(lambda: len(rendered) == 2, timeout=1000)
+
+        qimage_widget.set_colormap("plasma")
+        qimage_widget.update_frame(frame)
+        qtbot.waitUntil(lambda: len(rendered) == 3, timeout=1000)
+
+
+class TestIntensityHeatmapConvert:
+    """Tests for the dtype branches of IntensityHeatmap._convert_frame."""
+
+    def test_mono_u8_passthrough(self, heatmap):
+        """uint8 mono frames skip conversion; range is known a priori."""
+        frame = np.full((16, 16), 7, dtype=np.uint8)
+
+        gray, max_val = heatmap._convert_frame(frame)
+
+        assert gray is frame
+        assert max_val == 255.0
+
+    def test_rgb_u8_converts_to_gray_u8(self, heatmap):
+        """Contiguous RGB uint8 stays uint8 end-to-end."""
+        frame = np.zeros((16, 16, 3), dtype=np.uint8)
+        frame[..., 1] = 255  # Pure green
+
+        gray, max_val = heatmap._convert_frame(frame)
+
+        assert gray.shape == (16, 16)
+        assert gray.dtype == np.uint8
+        assert max_val == 255.0
+        # BT.601 green luma weight is 0.587
+        assert abs(int(gray[0, 0]) - 150) <= 2
+
+    def test_float32_passthrough(self, heatmap):
+        """2-D float32 frames are used as-is with their real max."""
+        frame = np.linspace(0.0, 2.0, 256, dtype=np.float32).reshape(16, 16)
+
+        gray, max_val = heatmap._convert_frame(frame)
+
+        assert gray is frame
+        assert max_val == pytest.approx(2.0)
+
+    def test_float32_all_zero_guards_range(self, heatmap):
+        """An all-zero frame must not produce a zero-width clim."""
+        frame = np.zeros((16, 16), dtype=np.float32)
+
+        _, max_val = heatmap._convert_frame(frame)
+
+        assert max_val == 1.0
+
+    def test_u16_mono_converts_to_float32(self, heatmap):
+        """Other dtypes go through the float32 gray buffer."""
+        frame = np.full((16, 16), 1000, dtype=np.uint16)
+
+        gray, max_val = heatmap._convert_frame(frame)
+
+        assert gray.dtype == np.float32
+        assert gray.shape == (16, 16)
+        assert max_val == pytest.approx(1000.0)
+
+
+class TestIntensityHeatmapQImage:
+    """Tests for the LUT-based QImage rendering path."""
+
+    def test_lut_rendering_matches_colormap(self, qimage_widget, qtbot):
+        """Rendered pixels come from the baked colormap table."""
+        frame = np.zeros((8, 8), dtype=np.uint8)
+        qimage_widget.update_frame(frame)
+
+        label = qimage_widget._image_label
+        qtbot.waitUntil(
+            lambda: label.pixmap() is not None and not label.pixmap().isNull(),
+            timeout=1000,
+        )
+
+        image = label.pixmap().toImage()
+        # Reproduce the LUT construction for entry 0 (value 0)
+        rgba = matplotlib.colormaps["viridis"](np.linspace(0, 1, 256))
+        expected = (rgba[0, :3] * 255).astype(np.uint8)
+
+        pixel = image.pixelColor(0, 0)
+        assert pixel.red() == expected[0]
+        assert pixel.green() == expected[1]
+        assert pixel.blue() == expected[2]
+
+    def test_clear_drops_pixmap(self, qimage_widget, qtbot):
+        """clear() empties the display."""
+        qimage_widget.update_frame(np.full((8, 8), 42, dtype=np.uint8))
+        label = qimage_widget._image_label
+        qtbot.waitUntil(
+            lambda: label.pixmap() is not None and not label.pixmap().isNull(),
+            timeout=1000,
+        )
+
+        qimage_widget.clear()
+
+        assert label.pixmap() is None or label.pixmap().isNull()